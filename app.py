@@ -1,627 +1,915 @@
-"""
-Text Tools · JSON Validator · Formatter · Editor · Viewer
-
-Main Streamlit application entry point.
-"""
-
-import streamlit as st
-import json
-from typing import Dict, Any, Optional
-import difflib
-from src.config import Config
-from src.editor import render_editor
-from src.validator import validate_json, validate_against_schema
-from src.formatter import format_json, minify_json
-from src.viewer import render_json_tree
-from src.utils import sanitize_text, init_session_state, add_to_undo_stack, detect_file_type
-
-def main():
-    """Main application function."""
-    st.set_page_config(
-        page_title="Text Tools · JSON Validator · Formatter · Editor · Viewer",
-        page_icon="🛠️",
-        layout="wide",
-        initial_sidebar_state="expanded"
-    )
-    
-    # Initialize session state
-    init_session_state()
-    
-    st.title("🛠️ Text Tools · JSON Validator · Formatter · Editor · Viewer")
-    st.markdown("Upload, validate, format, edit, and view text files (JSON, TXT, MD) with ease.")
-    
-    # Sidebar
-    render_sidebar()
-    
-    # Main content area
-    render_main_content()
-
-def render_sidebar():
-    """Render the sidebar with controls."""
-    st.sidebar.header("Controls")
-    
-    # Mode selector
-    mode = st.sidebar.selectbox(
-        "Mode",
-        ["Editor", "Viewer", "Validator", "Diff"],
-        key="mode"
-    )
-    
-    st.sidebar.markdown("---")
-    
-    # Upload/Paste area
-    st.sidebar.subheader("Input Text/JSON")
-    
-    # File upload - support multiple file types
-    uploaded_file = st.sidebar.file_uploader(
-        "Upload file",
-        type=['json', 'txt', 'md'],
-        help="Upload a JSON, TXT, or MD file to edit, validate, or format"
-    )
-    
-    # Text input
-    text_input = st.sidebar.text_area(
-        "Or paste text here:",
-        height=150,
-        placeholder='{\n  "example": "value"\n}\n\nor any text content...',
-        help="Paste JSON or any text content directly"
-    )
-    
-    # Process input - avoid unnecessary reruns
-    if uploaded_file is not None:
-        try:
-            content = uploaded_file.read().decode('utf-8')
-            file_extension = uploaded_file.name.split('.')[-1].lower()
-            
-            # Only update if content actually changed
-            if content != st.session_state.get('original_text', ''):
-                st.session_state.original_text = content
-                st.session_state.edited_text = content
-                st.session_state.file_type = file_extension if file_extension in ['json', 'txt', 'md'] else detect_file_type(content, uploaded_file.name)
-                # Don't call st.rerun() here to avoid refresh
-        except Exception as e:
-            st.sidebar.error(f"Error reading file: {str(e)}")
-    elif text_input and text_input != st.session_state.get('original_text', ''):
-        st.session_state.original_text = text_input
-        st.session_state.edited_text = text_input
-        st.session_state.file_type = detect_file_type(text_input)
-        # Don't call st.rerun() here to avoid refresh
-    
-    st.sidebar.markdown("---")
-    
-    # Schema validation toggle (only show for JSON mode)
-    current_mode = st.session_state.get('mode', 'Editor')
-    if current_mode in ["Validator", "Viewer"] or st.session_state.get('file_type', 'json') == 'json':
-        use_schema = st.sidebar.checkbox("Validate against JSON Schema", key="use_schema")
-        if use_schema:
-            schema_file = st.sidebar.file_uploader(
-                "Upload JSON Schema",
-                type=['json'],
-                key="schema_upload"
-            )
-            
-            if schema_file:
-                try:
-                    schema_content = schema_file.read().decode('utf-8')
-                    st.session_state.json_schema = schema_content
-                except Exception as e:
-                    st.sidebar.error(f"Error reading schema: {str(e)}")
-    
-    st.sidebar.markdown("---")
-    
-    # Format settings (only show for JSON)
-    if st.session_state.get('file_type', 'json') == 'json':
-        st.sidebar.subheader("JSON Format Settings")
-        indent = st.sidebar.selectbox(
-            "Indentation",
-            [2, 4, 0],
-            index=0,
-            help="0 = minified (no spaces)"
-        )
-        sort_keys = st.sidebar.checkbox("Sort keys", value=False)
-    else:
-        indent = 2
-        sort_keys = False
-    
-    st.sidebar.markdown("---")
-    
-    # Action buttons
-    st.sidebar.subheader("Actions")
-    col1, col2 = st.sidebar.columns(2)
-    
-    with col1:
-        if st.session_state.get('file_type', 'json') == 'json':
-            if st.button("Validate JSON", use_container_width=True):
-                validate_current_json()
-            if st.button("Format JSON", use_container_width=True):
-                format_current_json(indent, sort_keys)
-        else:
-            if st.button("Word Count", use_container_width=True):
-                show_text_stats()
-        
-        if st.button("Reset", use_container_width=True):
-            reset_text()
-    
-    with col2:
-        if st.session_state.get('file_type', 'json') == 'json':
-            if st.button("Minify JSON", use_container_width=True):
-                minify_current_json()
-        else:
-            if st.button("Clear", use_container_width=True):
-                clear_text()
-        
-        if st.button("Download", use_container_width=True):
-            # Set session state to show download options
-            st.session_state.show_download = True
-        if st.button("Undo", use_container_width=True):
-            undo_changes()
-
-def render_main_content():
-    """Render the main content area based on selected mode."""
-    mode = st.session_state.get('mode', 'Editor')
-    
-    # Show download options if requested
-    if st.session_state.get('show_download', False):
-        render_download_interface()
-        st.markdown("---")
-    
-    if mode == "Editor":
-        render_editor_mode()
-    elif mode == "Viewer":
-        render_viewer_mode()
-    elif mode == "Validator":
-        render_validator_mode()
-    elif mode == "Diff":
-        render_diff_mode()
-
-def render_download_interface():
-    """Render persistent download interface."""
-    current_text = st.session_state.get('edited_text', '')
-    if not current_text:
-        st.warning("No content to download.")
-        if st.button("Close Download", key="close_download_empty"):
-            st.session_state.show_download = False
-            st.rerun()
-        return
-    
-    st.subheader("📥 Download Options")
-    
-    # Create columns for layout
-    col1, col2, col3 = st.columns([2, 2, 1])
-    
-    with col1:
-        # File type selection
-        download_type = st.selectbox(
-            "Choose download format:",
-            ["json", "txt", "md"],
-            index=0 if st.session_state.get('file_type', 'json') == 'json' else 
-                  (1 if st.session_state.get('file_type', 'json') == 'txt' else 2),
-            help="Select the file format for download",
-            key="download_type_select"
-        )
-    
-    with col2:
-        # File name
-        filename = st.text_input(
-            "Filename (without extension):",
-            value="edited",
-            help="Enter the filename without extension",
-            key="download_filename"
-        )
-    
-    with col3:
-        # Close button
-        if st.button("✕ Close", key="close_download", help="Close download options"):
-            st.session_state.show_download = False
-            st.rerun()
-    
-    # MIME type mapping
-    mime_type_map = {
-        'json': 'application/json',
-        'txt': 'text/plain',
-        'md': 'text/markdown'
-    }
-    
-    # Download button row
-    col1, col2, col3 = st.columns([1, 1, 2])
-    
-    with col1:
-        # Download button
-        st.download_button(
-            label=f"📥 Download as {download_type.upper()}",
-            data=current_text,
-            file_name=f"{filename}.{download_type}",
-            mime=mime_type_map.get(download_type, 'text/plain'),
-            help=f"Download the current content as {download_type.upper()} file",
-            key="main_download_button"
-        )
-    
-    with col2:
-        # Copy to clipboard info
-        st.info("💡 Use Ctrl+A, Ctrl+C to copy all content")
-
-def render_editor_mode():
-    """Render the general editor interface."""
-    file_type = st.session_state.get('file_type', 'json')
-    
-    # Show proper title based on detected file type
-    file_type_display = {
-        'json': 'JSON',
-        'txt': 'Text',
-        'md': 'Markdown'
-    }
-    display_type = file_type_display.get(file_type, file_type.upper())
-    st.subheader(f"Text Editor ({display_type})")
-    
-    current_text = st.session_state.get('edited_text', '')
-    
-    # Determine language for syntax highlighting
-    language_map = {
-        'json': 'json',
-        'md': 'markdown',
-        'txt': 'text'
-    }
-    language = language_map.get(file_type, 'text')
-    
-    # Use a STABLE key that doesn't change with content
-    editor_key = f"main_editor_{file_type}"
-    
-    # Render editor - REMOVED the content change detection that caused refresh
-    edited_content = render_editor(
-        current_text,
-        key=editor_key,
-        height=400,
-        language=language
-    )
-    
-    # Only update session state if content actually changed and is different
-    if edited_content and edited_content != current_text:
-        # Don't add to undo stack on every keystroke - only on significant changes
-        if len(edited_content) - len(current_text) > 10 or len(current_text) - len(edited_content) > 10:
-            add_to_undo_stack(current_text)
-        st.session_state.edited_text = edited_content
-    
-    # Show file info
-    if current_text:
-        show_file_info(current_text, file_type)
-
-def render_viewer_mode():
-    """Render the viewer interface."""
-    st.subheader("Content Viewer")
-    
-    current_text = st.session_state.get('edited_text', '')
-    file_type = st.session_state.get('file_type', 'json')
-    
-    if not current_text:
-        st.info("Upload or paste content to view it here.")
-        return
-    
-    if file_type == 'json':
-        # Parse and display JSON
-        try:
-            parsed_json = json.loads(current_text)
-            
-            # Show tree view
-            st.markdown("### Tree View")
-            render_json_tree(parsed_json)
-            
-            # Show formatted text
-            st.markdown("### Formatted Text")
-            formatted = format_json(current_text, indent=2, sort_keys=False)
-            st.code(formatted, language="json")
-            
-        except json.JSONDecodeError as e:
-            st.error(f"Invalid JSON: {e.msg} at line {e.lineno}, column {e.colno}")
-    else:
-        # Display text content
-        st.markdown("### Content")
-        if file_type == 'md':
-            # Render markdown
-            st.markdown(current_text)
-            st.markdown("### Raw Markdown")
-            st.code(current_text, language="markdown")
-        else:
-            # Display as text
-            st.code(current_text, language="text")
-
-def render_validator_mode():
-    """Render the validator interface with editor."""
-    st.subheader("JSON Validator with Editor")
-    
-    # Add editor for validation
-    st.markdown("### Edit JSON to Validate")
-    
-    # Get current content or start with empty
-    validator_content = st.session_state.get('validator_text', st.session_state.get('edited_text', ''))
-    
-    # Use STABLE key for validator editor
-    validator_key = "validator_editor_stable"
-    edited_validator_content = render_editor(
-        validator_content,
-        key=validator_key,
-        height=300,
-        language="json"
-    )
-    
-    # Update session state if content changed
-    if edited_validator_content and edited_validator_content != validator_content:
-        st.session_state.validator_text = edited_validator_content
-    
-    st.markdown("---")
-    
-    # Validate button
-    col1, col2, col3 = st.columns([1, 1, 2])
-    
-    with col1:
-        validate_btn = st.button("🔍 Validate JSON", type="primary")
-    
-    with col2:
-        if st.button("📋 Copy from Editor"):
-            st.session_state.validator_text = st.session_state.get('edited_text', '')
-            st.rerun()
-    
-    # Show validation results when button is clicked
-    if validate_btn:
-        current_json = st.session_state.get('validator_text', '')
-        if not current_json:
-            st.warning("No JSON to validate.")
-        else:
-            st.markdown("### Validation Results")
-            
-            # Validate JSON syntax
-            is_valid, errors = validate_json(current_json)
-            
-            if is_valid:
-                st.success("✅ Valid JSON syntax")
-                
-                # Schema validation if enabled
-                if st.session_state.get('use_schema', False) and st.session_state.get('json_schema'):
-                    schema_errors = validate_against_schema(current_json, st.session_state.json_schema)
-                    if not schema_errors:
-                        st.success("✅ Valid against JSON Schema")
-                    else:
-                        st.error("❌ Schema validation errors:")
-                        for error in schema_errors:
-                            st.error(f"Path: {error['path']} - {error['message']}")
-            else:
-                st.error("❌ Invalid JSON syntax")
-                for error in errors:
-                    # Display detailed error information
-                    st.code(error, language="text")
-
-def render_diff_mode():
-    """Render the diff interface with manual input capability."""
-    st.subheader("Text Diff")
-    
-    # Create two columns for manual input
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**Original**")
-        original_manual = st.text_area(
-            "Original Text",
-            value=st.session_state.get('original_text', ''),
-            height=300,
-            key="diff_original"
-        )
-    
-    with col2:
-        st.markdown("**Modified**")
-        modified_manual = st.text_area(
-            "Modified Text", 
-            value=st.session_state.get('edited_text', ''),
-            height=300,
-            key="diff_modified"
-        )
-    
-    # Update session state with manual inputs
-    if original_manual != st.session_state.get('original_text', ''):
-        st.session_state.original_text = original_manual
-    
-    if modified_manual != st.session_state.get('edited_text', ''):
-        st.session_state.edited_text = modified_manual
-    
-    original = st.session_state.get('original_text', '')
-    edited = st.session_state.get('edited_text', '')
-    
-    if not original and not edited:
-        st.info("Enter text content in both text areas above to compare.")
-        return
-    
-    if original == edited:
-        st.success("No changes detected.")
-        return
-    
-    # Show diff
-    st.markdown("---")
-    diff_type = st.radio("Diff view:", ["Side by side", "Unified"], horizontal=True)
-    
-    if diff_type == "Side by side":
-        show_side_by_side_diff(original, edited)
-    else:
-        show_unified_diff(original, edited)
-
-def show_side_by_side_diff(original: str, edited: str):
-    """Show side-by-side diff with highlighting."""
-    original_lines = original.splitlines()
-    edited_lines = edited.splitlines()
-    
-    # Get line-by-line diff
-    differ = difflib.unified_diff(original_lines, edited_lines, lineterm='')
-    diff_lines = list(differ)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**Original**")
-        original_html = []
-        for i, line in enumerate(original_lines, 1):
-            # Check if this line is deleted
-            is_deleted = any(f"-{line}" in d for d in diff_lines)
-            if is_deleted:
-                original_html.append(f'<div style="background-color: #ffebee; color: #c62828; padding: 2px;">{i:3d}: {line}</div>')
-            else:
-                original_html.append(f'<div style="padding: 2px;">{i:3d}: {line}</div>')
-        
-        st.markdown('<div style="font-family: monospace; font-size: 12px;">' + '\n'.join(original_html) + '</div>', unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("**Modified**")
-        edited_html = []
-        for i, line in enumerate(edited_lines, 1):
-            # Check if this line is added
-            is_added = any(f"+{line}" in d for d in diff_lines)
-            if is_added:
-                edited_html.append(f'<div style="background-color: #e8f5e8; color: #2e7d32; padding: 2px;">{i:3d}: {line}</div>')
-            else:
-                edited_html.append(f'<div style="padding: 2px;">{i:3d}: {line}</div>')
-        
-        st.markdown('<div style="font-family: monospace; font-size: 12px;">' + '\n'.join(edited_html) + '</div>', unsafe_allow_html=True)
-
-def show_unified_diff(original: str, edited: str):
-    """Show unified diff."""
-    original_lines = original.splitlines(keepends=True)
-    edited_lines = edited.splitlines(keepends=True)
-    
-    diff = difflib.unified_diff(
-        original_lines,
-        edited_lines,
-        fromfile="original",
-        tofile="modified",
-        lineterm=""
-    )
-    
-    diff_text = ''.join(diff)
-    if diff_text:
-        st.code(diff_text, language="diff")
-    else:
-        st.info("No differences found.")
-
-def show_file_info(content: str, file_type: str):
-    """Show file statistics."""
-    st.markdown("---")
-    st.markdown("### File Information")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Characters", len(content))
-    
-    with col2:
-        word_count = len(content.split()) if content else 0
-        st.metric("Words", word_count)
-    
-    with col3:
-        line_count = len(content.splitlines()) if content else 0
-        st.metric("Lines", line_count)
-    
-    with col4:
-        size_bytes = len(content.encode('utf-8'))
-        size_kb = size_bytes / 1024
-        st.metric("Size", f"{size_kb:.1f} KB")
-
-def show_download_options():
-    """Show download options with file type selection."""
-    # This function is now replaced by render_download_interface()
-    # Keeping it for backward compatibility, but it just sets the session state
-    st.session_state.show_download = True
-
-def validate_current_json():
-    """Validate the current JSON and show results."""
-    current_json = st.session_state.get('edited_text', '')
-    if not current_json:
-        st.warning("No JSON to validate.")
-        return
-    
-    is_valid, errors = validate_json(current_json)
-    if is_valid:
-        st.success("✅ JSON is valid!")
-    else:
-        st.error("❌ JSON validation failed:")
-        for error in errors:
-            st.code(error, language="text")
-
-def format_current_json(indent: int, sort_keys: bool):
-    """Format the current JSON."""
-    current_json = st.session_state.get('edited_text', '')
-    if not current_json:
-        st.warning("No JSON to format.")
-        return
-    
-    try:
-        if indent == 0:
-            formatted = minify_json(current_json)
-            success_msg = "JSON minified successfully!"
-        else:
-            formatted = format_json(current_json, indent=indent, sort_keys=sort_keys)
-            success_msg = "JSON formatted successfully!"
-        
-        add_to_undo_stack(current_json)
-        st.session_state.edited_text = formatted
-        st.success(success_msg)
-        
-    except Exception as e:
-        st.error(f"Error formatting JSON: {str(e)}")
-
-def minify_current_json():
-    """Minify the current JSON."""
-    current_json = st.session_state.get('edited_text', '')
-    if not current_json:
-        st.warning("No JSON to minify.")
-        return
-    
-    try:
-        minified = minify_json(current_json)
-        add_to_undo_stack(current_json)
-        st.session_state.edited_text = minified
-        st.success("JSON minified successfully!")
-        
-    except Exception as e:
-        st.error(f"Error minifying JSON: {str(e)}")
-
-def show_text_stats():
-    """Show text statistics."""
-    current_text = st.session_state.get('edited_text', '')
-    if not current_text:
-        st.warning("No text to analyze.")
-        return
-    
-    # Calculate stats
-    char_count = len(current_text)
-    word_count = len(current_text.split())
-    line_count = len(current_text.splitlines())
-    paragraph_count = len([p for p in current_text.split('\n\n') if p.strip()])
-    
-    st.info(f"📊 **Text Stats:** {char_count} characters, {word_count} words, {line_count} lines, {paragraph_count} paragraphs")
-
-def clear_text():
-    """Clear the current text."""
-    if st.session_state.get('edited_text'):
-        add_to_undo_stack(st.session_state.get('edited_text', ''))
-        st.session_state.edited_text = ''
-        st.success("Text cleared!")
-    else:
-        st.warning("No text to clear.")
-
-def reset_text():
-    """Reset text to original state."""
-    if st.session_state.get('original_text'):
-        add_to_undo_stack(st.session_state.get('edited_text', ''))
-        st.session_state.edited_text = st.session_state.original_text
-        st.success("Text reset to original!")
-    else:
-        st.warning("No original text to reset to.")
-
-def undo_changes():
-    """Undo the last change."""
-    undo_stack = st.session_state.get('undo_stack', [])
-    if undo_stack:
-        previous_state = undo_stack.pop()
-        st.session_state.edited_text = previous_state
-        st.session_state.undo_stack = undo_stack
-        st.success("Changes undone!")
-    else:
-        st.warning("No changes to undo.")
-
-if __name__ == "__main__":
+"""
+Text Tools · JSON Validator · Formatter · Editor · Viewer
+
+Main Streamlit application entry point.
+"""
+
+import streamlit as st
+import json
+import hashlib
+import html
+import io
+import itertools
+from typing import Dict, Any, Optional, Set, Tuple
+from src.config import Config
+
+# Try to import rapidfuzz for C++-accelerated diff opcodes, fall back to difflib
+try:
+    from rapidfuzz.distance import Indel
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Try to import faster JSON parsers, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import simdjson
+    _simdjson_parser = simdjson.Parser()
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+from src.editor import render_editor
+from src.validator import validate_json, validate_against_schema
+from src.formatter import format_json, minify_json
+from src.utils import sanitize_text, init_session_state, add_to_undo_stack, pop_from_undo_stack, detect_file_type
+
+# difflib and src.viewer are imported lazily inside the Diff/Viewer
+# handlers so modes the user never opens don't contribute to cold start
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _parse_json_cached(text: str) -> Any:
+    """
+    Parse JSON once per unique content; identical reruns hit the cache.
+
+    Always parses with stdlib json: orjson reads integers outside the
+    64-bit range as floats, which would silently corrupt values shown
+    in the viewer and written back by Format/Minify.
+    """
+    return json.loads(text)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _format_json_cached(text: str, indent: int, sort_keys: bool) -> str:
+    """Format JSON once per (content, indent, sort_keys) combination."""
+    # orjson writes NaN/Infinity (which stdlib json accepts) as null
+    # without raising, so texts that may contain those tokens skip the
+    # fast path entirely rather than get silently rewritten
+    if (ORJSON_AVAILABLE and indent in (0, 2)
+            and 'NaN' not in text and 'Infinity' not in text):
+        # Serialize at C speed, but parse with stdlib so out-of-64-bit
+        # integers keep their exact value; orjson refuses to serialize
+        # such integers, so fall through to the stdlib formatter then
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(json.loads(text), option=option).decode('utf-8')
+        except TypeError:
+            pass
+    return format_json(text, indent=indent, sort_keys=sort_keys)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _validate_json_cached(text: str) -> Tuple[bool, list]:
+    """Validate JSON once per unique content; reruns reuse the result."""
+    if SIMDJSON_AVAILABLE:
+        # Fast accept path: simdjson validates without materializing the
+        # Python object graph. Fall through for detailed error messages.
+        try:
+            _simdjson_parser.parse(text.encode('utf-8'))
+            return True, []
+        except ValueError:
+            pass
+    return validate_json(text)
+
+# Static option maps, hoisted so hot render paths don't rebuild them per rerun
+_MIME_TYPES = {
+    'json': 'application/json',
+    'txt': 'text/plain',
+    'md': 'text/markdown'
+}
+_EDITOR_LANGUAGES = {
+    'json': 'json',
+    'md': 'markdown',
+    'txt': 'text'
+}
+_FILE_TYPE_DISPLAY = {
+    'json': 'JSON',
+    'txt': 'Text',
+    'md': 'Markdown'
+}
+
+# File-type detection rarely needs more than this much content
+_DETECT_PREFIX_CHARS = 4096
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _detect_file_type_cached(content_prefix: str, truncated: bool, filename: str = '') -> str:
+    """
+    Detect file type from a bounded content prefix (cached).
+
+    Caching on the prefix keeps the cache key cheap to hash and avoids
+    re-running the regex/JSON sniffing on every keystroke. A truncated
+    prefix is classified as JSON only if it parses cleanly up to the
+    cut, so bracket-prefixed text like '[INFO] ...' log lines still
+    falls through to the normal sniff.
+    """
+    if truncated and content_prefix.lstrip()[:1] in ('{', '['):
+        try:
+            json.loads(content_prefix)
+            return 'json'
+        except json.JSONDecodeError as e:
+            # A valid document cut mid-stream scans cleanly until the
+            # cut: the error lands at the end of the prefix or in a
+            # token (string) that runs into it. An earlier error means
+            # the content merely starts with a bracket
+            if e.pos >= len(content_prefix) - 1 or e.msg.startswith('Unterminated'):
+                return 'json'
+    return detect_file_type(content_prefix, filename or None)
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _text_stats_cached(content: str) -> Dict[str, Any]:
+    """Compute text statistics once per unique content."""
+    return {
+        'chars': len(content),
+        'words': len(content.split()) if content else 0,
+        # count('\n') avoids allocating the splitlines() list
+        'lines': (content.count('\n') + (0 if content.endswith('\n') else 1)) if content else 0,
+        'paragraphs': len([p for p in content.split('\n\n') if p.strip()]),
+        'bytes': len(content.encode('utf-8'))
+    }
+
+def main():
+    """Main application function."""
+    st.set_page_config(
+        page_title="Text Tools · JSON Validator · Formatter · Editor · Viewer",
+        page_icon="🛠️",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    
+    # Initialize session state
+    init_session_state()
+    
+    st.title("🛠️ Text Tools · JSON Validator · Formatter · Editor · Viewer")
+    st.markdown("Upload, validate, format, edit, and view text files (JSON, TXT, MD) with ease.")
+    
+    # Sidebar
+    render_sidebar()
+    
+    # Main content area
+    render_main_content()
+
+def render_sidebar():
+    """Render the sidebar with controls."""
+    # Snapshot the proxy once: plain dict lookups beat SessionStateProxy
+    # attribute dispatch on a function with this many reads
+    ss = st.session_state
+
+    st.sidebar.header("Controls")
+    
+    # Mode selector
+    mode = st.sidebar.selectbox(
+        "Mode",
+        ["Editor", "Viewer", "Validator", "Diff"],
+        key="mode"
+    )
+    
+    st.sidebar.markdown("---")
+    
+    # Upload/Paste area
+    st.sidebar.subheader("Input Text/JSON")
+    
+    # File upload - support multiple file types
+    uploaded_file = st.sidebar.file_uploader(
+        "Upload file",
+        type=['json', 'txt', 'md'],
+        help="Upload a JSON, TXT, or MD file to edit, validate, or format"
+    )
+    
+    # Text input
+    text_input = st.sidebar.text_area(
+        "Or paste text here:",
+        height=150,
+        placeholder='{\n  "example": "value"\n}\n\nor any text content...',
+        help="Paste JSON or any text content directly"
+    )
+    
+    # Process input - avoid unnecessary reruns
+    if uploaded_file is not None:
+        try:
+            if uploaded_file.size > Config.MAX_FILE_SIZE_BYTES:
+                st.sidebar.error(Config.ERROR_MESSAGES['file_too_large'])
+            else:
+                # Hash the raw bytes in chunks first so unchanged uploads
+                # skip the decode and no full bytes copy is materialized
+                hasher = hashlib.blake2b(digest_size=16)
+                uploaded_file.seek(0)
+                for chunk in iter(lambda: uploaded_file.read(65536), b''):
+                    hasher.update(chunk)
+                content_hash = hasher.digest()
+
+                # Only decode and update if content actually changed
+                if content_hash != ss.get('original_hash'):
+                    # Incremental decode straight off the upload buffer:
+                    # peak memory is the decoded str plus one 64 KB chunk,
+                    # not bytes copy + str
+                    uploaded_file.seek(0)
+                    wrapper = io.TextIOWrapper(uploaded_file, encoding='utf-8')
+                    try:
+                        content = wrapper.read()
+                    finally:
+                        # Detach so the wrapper doesn't close the
+                        # UploadedFile that Streamlit still owns
+                        wrapper.detach()
+                    file_extension = uploaded_file.name.split('.')[-1].lower()
+                    ss.original_text = content
+                    # Share the same string object until the editor mutates it
+                    ss.edited_text = content
+                    ss.original_hash = content_hash
+                    ss.file_type = file_extension if file_extension in ['json', 'txt', 'md'] else _detect_file_type_cached(
+                        content[:_DETECT_PREFIX_CHARS], len(content) > _DETECT_PREFIX_CHARS, uploaded_file.name)
+                    # Don't call st.rerun() here to avoid refresh
+        except Exception as e:
+            st.sidebar.error(f"Error reading file: {str(e)}")
+    elif text_input and text_input != ss.get('original_text', ''):
+        ss.original_text = text_input
+        ss.edited_text = text_input
+        ss.original_hash = hashlib.blake2b(text_input.encode('utf-8'), digest_size=16).digest()
+        ss.file_type = _detect_file_type_cached(
+            text_input[:_DETECT_PREFIX_CHARS], len(text_input) > _DETECT_PREFIX_CHARS)
+        # Don't call st.rerun() here to avoid refresh
+    
+    st.sidebar.markdown("---")
+    
+    # Read once after the input branches may have updated it
+    file_type = ss.get('file_type', 'json')
+
+    # Schema validation toggle (only show for JSON mode)
+    current_mode = ss.get('mode', 'Editor')
+    if current_mode in ["Validator", "Viewer"] or file_type == 'json':
+        use_schema = st.sidebar.checkbox("Validate against JSON Schema", key="use_schema")
+        if use_schema:
+            schema_file = st.sidebar.file_uploader(
+                "Upload JSON Schema",
+                type=['json'],
+                key="schema_upload"
+            )
+            
+            if schema_file:
+                try:
+                    # Hash the raw bytes and only decode when they changed
+                    raw_schema = schema_file.getvalue()
+                    schema_hash = hashlib.blake2b(raw_schema, digest_size=16).digest()
+                    if schema_hash != ss.get('schema_hash'):
+                        ss.json_schema = raw_schema.decode('utf-8')
+                        ss.schema_hash = schema_hash
+                except Exception as e:
+                    st.sidebar.error(f"Error reading schema: {str(e)}")
+    
+    st.sidebar.markdown("---")
+    
+    # Format settings (only show for JSON)
+    if file_type == 'json':
+        st.sidebar.subheader("JSON Format Settings")
+        indent = st.sidebar.selectbox(
+            "Indentation",
+            [2, 4, 0],
+            index=0,
+            help="0 = minified (no spaces)"
+        )
+        sort_keys = st.sidebar.checkbox("Sort keys", value=False)
+    else:
+        indent = 2
+        sort_keys = False
+    
+    st.sidebar.markdown("---")
+    
+    # Action buttons
+    st.sidebar.subheader("Actions")
+    col1, col2 = st.sidebar.columns(2)
+    
+    with col1:
+        if file_type == 'json':
+            if st.button("Validate JSON", use_container_width=True):
+                validate_current_json()
+            if st.button("Format JSON", use_container_width=True):
+                format_current_json(indent, sort_keys)
+        else:
+            if st.button("Word Count", use_container_width=True):
+                show_text_stats()
+        
+        if st.button("Reset", use_container_width=True):
+            reset_text()
+    
+    with col2:
+        if file_type == 'json':
+            if st.button("Minify JSON", use_container_width=True):
+                minify_current_json()
+        else:
+            if st.button("Clear", use_container_width=True):
+                clear_text()
+        
+        if st.button("Download", use_container_width=True):
+            # Set session state to show download options
+            ss.show_download = True
+        if st.button("Undo", use_container_width=True):
+            undo_changes()
+
+def render_main_content():
+    """Render the main content area based on selected mode."""
+    ss = st.session_state
+    mode = ss.get('mode', 'Editor')
+    
+    # Show download options if requested
+    if ss.get('show_download', False):
+        render_download_interface()
+        st.markdown("---")
+    
+    if mode == "Editor":
+        render_editor_mode()
+    elif mode == "Viewer":
+        render_viewer_mode()
+    elif mode == "Validator":
+        render_validator_mode()
+    elif mode == "Diff":
+        render_diff_mode()
+
+def render_download_interface():
+    """Render persistent download interface."""
+    ss = st.session_state
+    current_text = ss.get('edited_text', '')
+    if not current_text:
+        st.warning("No content to download.")
+        if st.button("Close Download", key="close_download_empty"):
+            ss.show_download = False
+            st.rerun()
+        return
+    
+    st.subheader("📥 Download Options")
+    
+    # Create columns for layout
+    col1, col2, col3 = st.columns([2, 2, 1])
+    
+    with col1:
+        # File type selection
+        download_type = st.selectbox(
+            "Choose download format:",
+            ["json", "txt", "md"],
+            index=0 if ss.get('file_type', 'json') == 'json' else 
+                  (1 if ss.get('file_type', 'json') == 'txt' else 2),
+            help="Select the file format for download",
+            key="download_type_select"
+        )
+    
+    with col2:
+        # File name
+        filename = st.text_input(
+            "Filename (without extension):",
+            value="edited",
+            help="Enter the filename without extension",
+            key="download_filename"
+        )
+    
+    with col3:
+        # Close button
+        if st.button("✕ Close", key="close_download", help="Close download options"):
+            ss.show_download = False
+            st.rerun()
+    
+    # Download button row
+    col1, col2, col3 = st.columns([1, 1, 2])
+    
+    with col1:
+        # Download button
+        st.download_button(
+            label=f"📥 Download as {download_type.upper()}",
+            data=current_text,
+            file_name=f"{filename}.{download_type}",
+            mime=_MIME_TYPES.get(download_type, 'text/plain'),
+            help=f"Download the current content as {download_type.upper()} file",
+            key="main_download_button"
+        )
+    
+    with col2:
+        # Copy to clipboard info
+        st.info("💡 Use Ctrl+A, Ctrl+C to copy all content")
+
+def render_editor_mode():
+    """Render the general editor interface."""
+    ss = st.session_state
+    file_type = ss.get('file_type', 'json')
+    
+    # Show proper title based on detected file type
+    display_type = _FILE_TYPE_DISPLAY.get(file_type, file_type.upper())
+    st.subheader(f"Text Editor ({display_type})")
+
+    current_text = ss.get('edited_text', '')
+
+    # Determine language for syntax highlighting
+    language = _EDITOR_LANGUAGES.get(file_type, 'text')
+    
+    # Use a STABLE key that doesn't change with content
+    editor_key = f"main_editor_{file_type}"
+    
+    # Render editor - REMOVED the content change detection that caused refresh
+    edited_content = render_editor(
+        current_text,
+        key=editor_key,
+        height=400,
+        language=language
+    )
+    
+    # Only update session state if content actually changed and is different
+    # (identity check first - the editor returns the same object when untouched)
+    if edited_content is not current_text and edited_content and edited_content != current_text:
+        # Don't add to undo stack on every keystroke - only on significant changes
+        if abs(len(edited_content) - len(current_text)) > 10:
+            add_to_undo_stack(current_text)
+        ss.edited_text = edited_content
+    
+    # Show file info
+    if current_text:
+        show_file_info(current_text, file_type)
+
+def render_viewer_mode():
+    """Render the viewer interface."""
+    st.subheader("Content Viewer")
+    
+    current_text = st.session_state.get('edited_text', '')
+    file_type = st.session_state.get('file_type', 'json')
+    
+    if not current_text:
+        st.info("Upload or paste content to view it here.")
+        return
+    
+    if file_type == 'json':
+        from src.viewer import render_json_tree
+
+        # Parse and display JSON
+        try:
+            parsed_json = _parse_json_cached(current_text)
+
+            # Show tree view
+            st.markdown("### Tree View")
+            render_json_tree(parsed_json)
+
+            # Show formatted text
+            st.markdown("### Formatted Text")
+            formatted = _format_json_cached(current_text, 2, False)
+            st.code(formatted, language="json")
+            
+        except json.JSONDecodeError as e:
+            st.error(f"Invalid JSON: {e.msg} at line {e.lineno}, column {e.colno}")
+        except ValueError as e:
+            # Non-stdlib parser backends may raise a plain ValueError
+            st.error(f"Invalid JSON: {e}")
+    else:
+        # Display text content
+        st.markdown("### Content")
+        if file_type == 'md':
+            # Render markdown
+            st.markdown(current_text)
+            st.markdown("### Raw Markdown")
+            st.code(current_text, language="markdown")
+        else:
+            # Display as text
+            st.code(current_text, language="text")
+
+def render_validator_mode():
+    """Render the validator interface with editor."""
+    st.subheader("JSON Validator with Editor")
+    
+    # Add editor for validation
+    st.markdown("### Edit JSON to Validate")
+    
+    # Get current content or start with empty
+    validator_content = st.session_state.get('validator_text', st.session_state.get('edited_text', ''))
+    
+    # Use STABLE key for validator editor
+    validator_key = "validator_editor_stable"
+    edited_validator_content = render_editor(
+        validator_content,
+        key=validator_key,
+        height=300,
+        language="json"
+    )
+    
+    # Update session state if content changed
+    if edited_validator_content and edited_validator_content != validator_content:
+        st.session_state.validator_text = edited_validator_content
+    
+    st.markdown("---")
+    
+    # Validate button
+    col1, col2, col3 = st.columns([1, 1, 2])
+    
+    with col1:
+        validate_btn = st.button("🔍 Validate JSON", type="primary")
+    
+    with col2:
+        if st.button("📋 Copy from Editor"):
+            st.session_state.validator_text = st.session_state.get('edited_text', '')
+            st.rerun()
+    
+    # Show validation results when button is clicked
+    if validate_btn:
+        current_json = st.session_state.get('validator_text', '')
+        if not current_json:
+            st.warning("No JSON to validate.")
+        else:
+            st.markdown("### Validation Results")
+            
+            # Validate JSON syntax
+            is_valid, errors = validate_json(current_json)
+            
+            if is_valid:
+                st.success("✅ Valid JSON syntax")
+                
+                # Schema validation if enabled
+                if st.session_state.get('use_schema', False) and st.session_state.get('json_schema'):
+                    schema_errors = validate_against_schema(current_json, st.session_state.json_schema)
+                    if not schema_errors:
+                        st.success("✅ Valid against JSON Schema")
+                    else:
+                        st.error("❌ Schema validation errors:")
+                        for error in schema_errors:
+                            st.error(f"Path: {error['path']} - {error['message']}")
+            else:
+                st.error("❌ Invalid JSON syntax")
+                for error in errors:
+                    # Display detailed error information
+                    st.code(error, language="text")
+
+def render_diff_mode():
+    """Render the diff interface with manual input capability."""
+    st.subheader("Text Diff")
+    
+    # Create two columns for manual input
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**Original**")
+        original_manual = st.text_area(
+            "Original Text",
+            value=st.session_state.get('original_text', ''),
+            height=300,
+            key="diff_original"
+        )
+    
+    with col2:
+        st.markdown("**Modified**")
+        modified_manual = st.text_area(
+            "Modified Text", 
+            value=st.session_state.get('edited_text', ''),
+            height=300,
+            key="diff_modified"
+        )
+    
+    # Update session state with manual inputs
+    if original_manual != st.session_state.get('original_text', ''):
+        st.session_state.original_text = original_manual
+    
+    if modified_manual != st.session_state.get('edited_text', ''):
+        st.session_state.edited_text = modified_manual
+    
+    original = st.session_state.get('original_text', '')
+    edited = st.session_state.get('edited_text', '')
+    
+    if not original and not edited:
+        st.info("Enter text content in both text areas above to compare.")
+        return
+    
+    # Compare 16-byte fingerprints instead of walking both full strings
+    if _content_hash(original, 'original_text_hash') == _content_hash(edited, 'edited_text_hash'):
+        st.success("No changes detected.")
+        return
+    
+    # Show diff
+    st.markdown("---")
+    diff_type = st.radio("Diff view:", ["Side by side", "Unified"], horizontal=True)
+    
+    if diff_type == "Side by side":
+        show_side_by_side_diff(original, edited)
+    else:
+        show_unified_diff(original, edited)
+
+def get_diff_line_indices(original_lines: list, edited_lines: list) -> Tuple[Set[int], Set[int]]:
+    """
+    Compute which line indices are deleted/added between two line lists.
+
+    Uses rapidfuzz's C++ opcodes when available, otherwise difflib's
+    SequenceMatcher. Both produce the same opcode tags, so classification
+    is a single pass building index sets instead of scanning diff output
+    per line.
+
+    Args:
+        original_lines: Lines of the original text
+        edited_lines: Lines of the edited text
+
+    Returns:
+        Tuple of (deleted_indices, added_indices) as 0-based line index sets
+    """
+    # Trivial cases: one side empty means the other is all changed
+    if not original_lines:
+        return set(), set(range(len(edited_lines)))
+    if not edited_lines:
+        return set(range(len(original_lines))), set()
+
+    if RAPIDFUZZ_AVAILABLE:
+        opcodes = Indel.opcodes(original_lines, edited_lines)
+    else:
+        import difflib
+        opcodes = difflib.SequenceMatcher(
+            None, original_lines, edited_lines, autojunk=False
+        ).get_opcodes()
+
+    deleted_idx = set()
+    added_idx = set()
+
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag in ('delete', 'replace'):
+            deleted_idx.update(range(i1, i2))
+        if tag in ('insert', 'replace'):
+            added_idx.update(range(j1, j2))
+
+    return deleted_idx, added_idx
+
+# Per-line styles for the side-by-side diff panels, built once
+_DIFF_PANEL_STYLE = 'font-family: monospace; font-size: 12px;'
+_DIFF_DEL_STYLE = 'background-color: #ffebee; color: #c62828; padding: 2px;'
+_DIFF_ADD_STYLE = 'background-color: #e8f5e8; color: #2e7d32; padding: 2px;'
+_DIFF_CTX_STYLE = 'padding: 2px;'
+_DIFF_GAP_STYLE = 'padding: 2px; color: #9e9e9e; font-style: italic;'
+_DIFF_CONTEXT_LINES = 3
+
+# Precompiled %-templates: C-level template parsing beats re-evaluating
+# an f-string with format specs on every line
+_DIFF_LINE_TMPL = '<div style="%s">%3d: %s</div>\n'
+_DIFF_CTX_TMPL = _DIFF_LINE_TMPL.replace('%s', _DIFF_CTX_STYLE, 1)
+_DIFF_GAP_TMPL = '<div style="' + _DIFF_GAP_STYLE + '">… %d unchanged lines …</div>\n'
+
+def _render_diff_panel(lines: list, changed_idx: Set[int], changed_style: str) -> str:
+    """
+    Build one diff panel's HTML, collapsing unchanged regions.
+
+    Only lines within _DIFF_CONTEXT_LINES of a change are emitted
+    individually; longer unchanged runs collapse into a single marker
+    div, keeping both the Python string work and the rendered DOM
+    proportional to the size of the change, not the document.
+
+    Args:
+        lines: Lines of one side of the diff
+        changed_idx: 0-based indices of changed lines on this side
+        changed_style: Inline CSS for changed lines
+
+    Returns:
+        HTML string for the panel
+    """
+    visible = set()
+    for idx in changed_idx:
+        visible.update(range(max(0, idx - _DIFF_CONTEXT_LINES),
+                             min(len(lines), idx + _DIFF_CONTEXT_LINES + 1)))
+
+    # Split the panel into visible/gap segments first, then emit each
+    # visible segment with a single comprehension: CPython specializes
+    # comprehension bytecode better than a write-per-line loop
+    segments = []
+    i = 0
+    total = len(lines)
+    while i < total:
+        seg_start = i
+        in_visible = i in visible or not changed_idx
+        while i < total and ((i in visible or not changed_idx) == in_visible):
+            i += 1
+        segments.append((seg_start, i, in_visible))
+
+    # Specialize the changed-line template once per panel
+    changed_tmpl = _DIFF_LINE_TMPL.replace('%s', changed_style, 1)
+    esc = html.escape
+
+    parts = [f'<div style="{_DIFF_PANEL_STYLE}">']
+    for seg_start, seg_end, is_visible in segments:
+        if is_visible:
+            parts.extend(
+                (changed_tmpl if j in changed_idx else _DIFF_CTX_TMPL) % (j + 1, esc(lines[j]))
+                for j in range(seg_start, seg_end)
+            )
+        else:
+            parts.append(_DIFF_GAP_TMPL % (seg_end - seg_start))
+    parts.append('</div>')
+
+    return ''.join(parts)
+
+def _content_hash(text: str, cache_key: str) -> bytes:
+    """
+    BLAKE2b fingerprint of text, cached in session state by identity.
+
+    Session state returns the same string object on no-op reruns, so the
+    identity check makes repeated hashing (and O(N) equality walks built
+    on top of it) effectively free until the content is replaced.
+    """
+    cached = st.session_state.get(cache_key)
+    if cached is not None and cached[0] is text:
+        return cached[1]
+
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    st.session_state[cache_key] = (text, digest)
+    return digest
+
+# Above this size, pure-Python SequenceMatcher can take seconds per rerun
+_DIFF_BUDGET_CHARS = 200_000
+
+def show_side_by_side_diff(original: str, edited: str):
+    """Show side-by-side diff with highlighting."""
+    # Fingerprint both sides first: if neither changed since the last
+    # rerun, re-emit the cached panels without recomputing the diff
+    diff_key = (hashlib.blake2b(original.encode('utf-8'), digest_size=16).digest(),
+                hashlib.blake2b(edited.encode('utf-8'), digest_size=16).digest())
+    cached = st.session_state.get('side_diff_cache')
+
+    if cached is not None and cached[0] == diff_key:
+        left_html, right_html = cached[1]
+    else:
+        if (max(len(original), len(edited)) > _DIFF_BUDGET_CHARS
+                and not RAPIDFUZZ_AVAILABLE):
+            st.warning(
+                "Content too large for side-by-side diff. Install `rapidfuzz` "
+                "for fast diffs on large files, or use the Unified view."
+            )
+            return
+
+        original_lines = original.splitlines()
+        edited_lines = edited.splitlines()
+
+        # Classify changed lines once via opcodes (O(N+M) membership tests)
+        deleted_idx, added_idx = get_diff_line_indices(original_lines, edited_lines)
+
+        left_html = _render_diff_panel(original_lines, deleted_idx, _DIFF_DEL_STYLE)
+        right_html = _render_diff_panel(edited_lines, added_idx, _DIFF_ADD_STYLE)
+        st.session_state.side_diff_cache = (diff_key, (left_html, right_html))
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Original**")
+        st.markdown(left_html, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("**Modified**")
+        st.markdown(right_html, unsafe_allow_html=True)
+
+# Bound on rendered unified-diff lines; st.code degrades well before this
+_UNIFIED_DIFF_MAX_LINES = 50_000
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _unified_diff_cached(original: str, edited: str) -> str:
+    """Compute a bounded unified diff once per content pair."""
+    import difflib
+
+    diff_iter = difflib.unified_diff(
+        original.splitlines(),
+        edited.splitlines(),
+        fromfile="original",
+        tofile="modified",
+        lineterm=""
+    )
+
+    lines = list(itertools.islice(diff_iter, _UNIFIED_DIFF_MAX_LINES))
+    if len(lines) == _UNIFIED_DIFF_MAX_LINES:
+        lines.append("... diff truncated ...")
+
+    return '\n'.join(lines)
+
+def show_unified_diff(original: str, edited: str):
+    """Show unified diff."""
+    diff_text = _unified_diff_cached(original, edited)
+    if diff_text:
+        st.code(diff_text, language="diff")
+    else:
+        st.info("No differences found.")
+
+def show_file_info(content: str, file_type: str):
+    """Show file statistics."""
+    st.markdown("---")
+    st.markdown("### File Information")
+    
+    stats = _text_stats_cached(content)
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Characters", stats['chars'])
+
+    with col2:
+        st.metric("Words", stats['words'])
+
+    with col3:
+        st.metric("Lines", stats['lines'])
+
+    with col4:
+        size_kb = stats['bytes'] / 1024
+        st.metric("Size", f"{size_kb:.1f} KB")
+
+def show_download_options():
+    """Show download options with file type selection."""
+    # This function is now replaced by render_download_interface()
+    # Keeping it for backward compatibility, but it just sets the session state
+    st.session_state.show_download = True
+
+def validate_current_json():
+    """Validate the current JSON and show results."""
+    current_json = st.session_state.get('edited_text', '')
+    if not current_json:
+        st.warning("No JSON to validate.")
+        return
+    
+    is_valid, errors = _validate_json_cached(current_json)
+    if is_valid:
+        st.success("✅ JSON is valid!")
+    else:
+        st.error("❌ JSON validation failed:")
+        for error in errors:
+            st.code(error, language="text")
+
+def format_current_json(indent: int, sort_keys: bool):
+    """Format the current JSON."""
+    current_json = st.session_state.get('edited_text', '')
+    if not current_json:
+        st.warning("No JSON to format.")
+        return
+    
+    try:
+        if indent == 0:
+            formatted = _format_json_cached(current_json, 0, False)
+            success_msg = "JSON minified successfully!"
+        else:
+            formatted = _format_json_cached(current_json, indent, sort_keys)
+            success_msg = "JSON formatted successfully!"
+        
+        add_to_undo_stack(current_json)
+        st.session_state.edited_text = formatted
+        st.success(success_msg)
+        
+    except Exception as e:
+        st.error(f"Error formatting JSON: {str(e)}")
+
+def minify_current_json():
+    """Minify the current JSON."""
+    current_json = st.session_state.get('edited_text', '')
+    if not current_json:
+        st.warning("No JSON to minify.")
+        return
+    
+    try:
+        minified = minify_json(current_json)
+        add_to_undo_stack(current_json)
+        st.session_state.edited_text = minified
+        st.success("JSON minified successfully!")
+        
+    except Exception as e:
+        st.error(f"Error minifying JSON: {str(e)}")
+
+def show_text_stats():
+    """Show text statistics."""
+    current_text = st.session_state.get('edited_text', '')
+    if not current_text:
+        st.warning("No text to analyze.")
+        return
+    
+    # Calculate stats (cached per unique content)
+    stats = _text_stats_cached(current_text)
+
+    st.info(f"📊 **Text Stats:** {stats['chars']} characters, {stats['words']} words, {stats['lines']} lines, {stats['paragraphs']} paragraphs")
+
+def clear_text():
+    """Clear the current text."""
+    if st.session_state.get('edited_text'):
+        add_to_undo_stack(st.session_state.get('edited_text', ''))
+        st.session_state.edited_text = ''
+        st.success("Text cleared!")
+    else:
+        st.warning("No text to clear.")
+
+def reset_text():
+    """Reset text to original state."""
+    if st.session_state.get('original_text'):
+        add_to_undo_stack(st.session_state.get('edited_text', ''))
+        st.session_state.edited_text = st.session_state.original_text
+        st.success("Text reset to original!")
+    else:
+        st.warning("No original text to reset to.")
+
+def undo_changes():
+    """Undo the last change."""
+    previous_state = pop_from_undo_stack()
+    if previous_state is not None:
+        st.session_state.edited_text = previous_state
+        st.success("Changes undone!")
+    else:
+        st.warning("No changes to undo.")
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
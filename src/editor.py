@@ -14,6 +14,12 @@ try:
 except ImportError:
     ACE_AVAILABLE = False
 
+# Available ACE color themes (tuple: immutable, faster membership checks)
+_ACE_THEMES = (
+    "monokai", "github", "tomorrow", "kuroir", "twilight", "xcode",
+    "textmate", "solarized_dark", "solarized_light", "terminal"
+)
+
 def render_editor(
     text: str,
     key: str,
@@ -53,14 +59,8 @@ def _render_ace_editor(
     auto_update: bool
 ) -> str:
     """Render ACE editor with advanced features."""
-    # Available themes for ACE
-    themes = [
-        "monokai", "github", "tomorrow", "kuroir", "twilight", "xcode",
-        "textmate", "solarized_dark", "solarized_light", "terminal"
-    ]
-    
     # Ensure theme is valid
-    if theme not in themes:
+    if theme not in _ACE_THEMES:
         theme = "monokai"
     
     try:
@@ -139,14 +139,9 @@ def render_editor_settings() -> dict:
         st.sidebar.subheader("Editor Settings")
         
         # Theme selection
-        themes = [
-            "monokai", "github", "tomorrow", "kuroir", "twilight",
-            "xcode", "textmate", "solarized_dark", "solarized_light"
-        ]
-        
         settings["theme"] = st.sidebar.selectbox(
             "Theme",
-            themes,
+            _ACE_THEMES,
             index=0,
             help="Choose editor color theme"
         )
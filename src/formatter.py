@@ -2,171 +2,363 @@
 JSON formatting and minification functions for Text Tools.
 """
 
+import functools
 import json
 from typing import Any, Optional
+from src.utils import utf8_len, has_content
+
+# Try to import orjson for native-speed parse/serialize, fall back to stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _loads(json_text: str) -> Any:
+    """
+    Parse JSON text for formatting.
+
+    Always stdlib: orjson reads integers outside the 64-bit range as
+    floats, and a formatter must never change values.
+    """
+    return json.loads(json_text)
+
+def _orjson_dump(option: int, fallback: Any, parsed_data: Any) -> str:
+    """
+    Serialize with orjson using a precomputed option bitmask.
+
+    Falls back to the stdlib serializer for values orjson refuses, such
+    as integers outside the 64-bit range. Non-finite floats do not raise
+    (orjson writes them as null), so documents containing NaN/Infinity
+    must be routed around this path entirely - see _has_nonfinite_tokens.
+    """
+    try:
+        return orjson.dumps(parsed_data, option=option).decode('utf-8')
+    except TypeError:
+        return fallback(parsed_data)
+
+def _has_nonfinite_tokens(json_text: str) -> bool:
+    """
+    Cheap scan for NaN/Infinity tokens, which stdlib json accepts and
+    round-trips but orjson silently serializes as null.
+
+    A false positive (the words inside a string value) only costs the
+    orjson fast path; correctness never depends on the scan being exact.
+    """
+    return 'NaN' in json_text or 'Infinity' in json_text
+
+def _build_formatters(use_orjson: bool) -> dict:
+    """
+    Build a (indent, sort_keys, ensure_ascii) -> serializer table.
+
+    Each entry is a partial with its arguments fully resolved, so the hot
+    path is one dict lookup and one call - no per-call indent/separator
+    ternaries or boolean-to-flag conversion.
+    """
+    table = {}
+    for indent in (0, 2, 4, 8):
+        for sort_keys in (False, True):
+            for ensure_ascii in (False, True):
+                serializer = functools.partial(
+                    json.dumps,
+                    indent=indent if indent > 0 else None,
+                    sort_keys=sort_keys,
+                    ensure_ascii=ensure_ascii,
+                    separators=(',', ': ') if indent > 0 else (',', ':')
+                )
+                # orjson handles the common shapes (minified or 2-space
+                # indent, UTF-8 output) at native speed; the stdlib
+                # partial rides along as its fallback
+                if use_orjson and ORJSON_AVAILABLE and not ensure_ascii and indent in (0, 2):
+                    option = orjson.OPT_INDENT_2 if indent == 2 else 0
+                    if sort_keys:
+                        option |= orjson.OPT_SORT_KEYS
+                    serializer = functools.partial(_orjson_dump, option, serializer)
+                table[(indent, sort_keys, ensure_ascii)] = serializer
+    return table
+
+_FORMATTERS = _build_formatters(use_orjson=True)
+
+# Stdlib-only twin for documents orjson would corrupt (NaN/Infinity)
+_STDLIB_FORMATTERS = _build_formatters(use_orjson=False)
+
+def _format_parsed(
+    parsed_data: Any,
+    indent: int = 2,
+    sort_keys: bool = False,
+    ensure_ascii: bool = False,
+    use_orjson: bool = True
+) -> str:
+    """
+    Serialize an already-parsed object - no reparse.
+
+    Args:
+        parsed_data: Parsed JSON data to serialize
+        indent: Number of spaces for indentation
+        sort_keys: Whether to sort object keys
+        ensure_ascii: Whether to escape non-ASCII characters
+        use_orjson: Whether the orjson fast path may be used; pass False
+            when the data contains non-finite floats
+
+    Returns:
+        Formatted JSON string
+    """
+    table = _FORMATTERS if use_orjson else _STDLIB_FORMATTERS
+    serializer = table.get((indent, sort_keys, ensure_ascii))
+    if serializer is not None:
+        return serializer(parsed_data)
+
+    # Indent outside the precomputed set - build the call the slow way
+    return json.dumps(
+        parsed_data,
+        indent=indent if indent > 0 else None,
+        sort_keys=sort_keys,
+        ensure_ascii=ensure_ascii,
+        separators=(',', ': ') if indent > 0 else (',', ':')
+    )
+
+# Only cache format results for documents below this size; the editor's
+# undo/redo loop re-formats the same small texts repeatedly, but caching
+# multi-MB strings would pin too much memory
+_FORMAT_CACHE_MAX_CHARS = 256 * 1024
 
 def format_json(
     json_text: str,
     indent: int = 2,
     sort_keys: bool = False,
-    ensure_ascii: bool = False
+    ensure_ascii: bool = False,
+    parsed: Optional[Any] = None
 ) -> str:
     """
     Format JSON with specified indentation and options.
-    
+
     Args:
         json_text: JSON string to format
         indent: Number of spaces for indentation
         sort_keys: Whether to sort object keys
         ensure_ascii: Whether to escape non-ASCII characters
-    
+        parsed: Optional pre-parsed data; when given, json_text is not reparsed
+
     Returns:
         Formatted JSON string
-    
+
     Raises:
         json.JSONDecodeError: If input is not valid JSON
         ValueError: If formatting fails
     """
-    if not json_text.strip():
-        raise ValueError("Empty JSON input")
-    
+    # Route small re-formats (undo/redo, option toggles) through the LRU
+    # cache; keyed on the full text so stale results are impossible
+    if parsed is None and len(json_text) < _FORMAT_CACHE_MAX_CHARS:
+        return _format_json_cached(json_text, indent, sort_keys, ensure_ascii)
+    return _format_json_uncached(json_text, indent, sort_keys, ensure_ascii, parsed)
+
+@functools.lru_cache(maxsize=32)
+def _format_json_cached(
+    json_text: str,
+    indent: int,
+    sort_keys: bool,
+    ensure_ascii: bool
+) -> str:
+    """Memoized parse+format path for small documents."""
+    return _format_json_uncached(json_text, indent, sort_keys, ensure_ascii, None)
+
+def _format_json_uncached(
+    json_text: str,
+    indent: int,
+    sort_keys: bool,
+    ensure_ascii: bool,
+    parsed: Optional[Any]
+) -> str:
+    """Parse (if needed) and serialize without consulting the cache."""
+    if parsed is None:
+        if not has_content(json_text):
+            raise ValueError("Empty JSON input")
+
+        try:
+            parsed = _loads(json_text)
+        except json.JSONDecodeError as e:
+            raise json.JSONDecodeError(f"Invalid JSON: {e.msg}", e.doc, e.pos)
+
     try:
-        # Parse JSON
-        parsed_data = json.loads(json_text)
-        
-        # Format with specified options
-        formatted = json.dumps(
-            parsed_data,
-            indent=indent if indent > 0 else None,
-            sort_keys=sort_keys,
-            ensure_ascii=ensure_ascii,
-            separators=(',', ': ') if indent > 0 else (',', ':')
+        # Stdlib json accepts NaN/Infinity, which orjson would silently
+        # turn into null; keep such documents on the stdlib serializer
+        return _format_parsed(
+            parsed, indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii,
+            use_orjson=not _has_nonfinite_tokens(json_text)
         )
-        
-        return formatted
-        
-    except json.JSONDecodeError as e:
-        raise json.JSONDecodeError(f"Invalid JSON: {e.msg}", e.doc, e.pos)
     except Exception as e:
         raise ValueError(f"Formatting failed: {str(e)}")
 
-def minify_json(json_text: str, ensure_ascii: bool = False) -> str:
+def minify_json(json_text: str, ensure_ascii: bool = False, parsed: Optional[Any] = None) -> str:
     """
     Minify JSON by removing all unnecessary whitespace.
-    
+
     Args:
         json_text: JSON string to minify
         ensure_ascii: Whether to escape non-ASCII characters
-    
+        parsed: Optional pre-parsed data to skip the reparse
+
     Returns:
         Minified JSON string
-    
+
     Raises:
         json.JSONDecodeError: If input is not valid JSON
     """
-    return format_json(json_text, indent=0, sort_keys=False, ensure_ascii=ensure_ascii)
+    return format_json(json_text, indent=0, sort_keys=False, ensure_ascii=ensure_ascii, parsed=parsed)
 
 def pretty_format_json(
     json_text: str,
     indent: int = 2,
-    sort_keys: bool = True
+    sort_keys: bool = True,
+    parsed: Optional[Any] = None
 ) -> str:
     """
     Format JSON with pretty printing options optimized for readability.
-    
+
     Args:
         json_text: JSON string to format
         indent: Number of spaces for indentation
         sort_keys: Whether to sort object keys
-    
+        parsed: Optional pre-parsed data to skip the reparse
+
     Returns:
         Pretty formatted JSON string
     """
-    return format_json(json_text, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
+    return format_json(json_text, indent=indent, sort_keys=sort_keys, ensure_ascii=False, parsed=parsed)
 
 def compact_format_json(json_text: str, max_line_length: int = 80) -> str:
     """
     Format JSON in a compact style that balances readability and space.
-    
+
+    Containers whose minified form fits within max_line_length are packed
+    onto one line; only those that don't fit are expanded, one child per
+    line. This keeps short arrays and objects readable without the full
+    vertical blow-up of a pretty print.
+
     Args:
         json_text: JSON string to format
         max_line_length: Target maximum line length
-    
+
     Returns:
         Compact formatted JSON string
+
+    Raises:
+        json.JSONDecodeError: If input is not valid JSON
     """
     try:
-        parsed_data = json.loads(json_text)
-        
-        # Use minimal indentation for compact format
-        formatted = json.dumps(
-            parsed_data,
-            indent=1,
-            sort_keys=False,
-            ensure_ascii=False,
-            separators=(',', ': ')
-        )
-        
-        return formatted
-        
+        parsed_data = _loads(json_text)
     except json.JSONDecodeError as e:
         raise json.JSONDecodeError(f"Invalid JSON: {e.msg}", e.doc, e.pos)
 
-def sort_json_keys(json_text: str, indent: int = 2) -> str:
+    return _compact_encode(
+        parsed_data, max_line_length,
+        use_orjson=not _has_nonfinite_tokens(json_text)
+    )
+
+def _compact_encode(
+    obj: Any,
+    max_line_length: int,
+    level: int = 0,
+    _memo: Optional[dict] = None,
+    use_orjson: bool = True
+) -> str:
+    """
+    Encode obj compactly, expanding only containers that overflow the line.
+
+    The minified form of each subtree is measured during emission (no
+    separate layout pass); measurements are memoized by object identity so
+    shared subtrees aren't re-serialized when their parent gets expanded.
+    """
+    if _memo is None:
+        _memo = {}
+
+    compact = _memo.get(id(obj))
+    if compact is None:
+        compact = _format_parsed(obj, indent=0, use_orjson=use_orjson)
+        _memo[id(obj)] = compact
+
+    indent = ' ' * level
+    if (len(compact) + len(indent) <= max_line_length
+            or not isinstance(obj, (dict, list)) or not obj):
+        return compact
+
+    # Too wide: open the container and lay out one child per line
+    child_level = level + 1
+    pad = ' ' * child_level
+    if isinstance(obj, dict):
+        items = [
+            f"{pad}{_format_parsed(key, indent=0)}: "
+            f"{_compact_encode(value, max_line_length, child_level, _memo, use_orjson)}"
+            for key, value in obj.items()
+        ]
+        return '{\n' + ',\n'.join(items) + '\n' + indent + '}'
+
+    items = [
+        pad + _compact_encode(value, max_line_length, child_level, _memo, use_orjson)
+        for value in obj
+    ]
+    return '[\n' + ',\n'.join(items) + '\n' + indent + ']'
+
+def sort_json_keys(json_text: str, indent: int = 2, parsed: Optional[Any] = None) -> str:
     """
     Sort all JSON object keys recursively.
-    
+
     Args:
         json_text: JSON string to process
         indent: Indentation for output
-    
+        parsed: Optional pre-parsed data to skip the reparse
+
     Returns:
         JSON with sorted keys
     """
-    return format_json(json_text, indent=indent, sort_keys=True)
+    return format_json(json_text, indent=indent, sort_keys=True, parsed=parsed)
 
-def normalize_json(json_text: str) -> str:
+def normalize_json(json_text: str, parsed: Optional[Any] = None) -> str:
     """
     Normalize JSON by parsing and re-serializing with standard formatting.
-    
+
     Args:
         json_text: JSON string to normalize
-    
+        parsed: Optional pre-parsed data to skip the reparse
+
     Returns:
         Normalized JSON string
     """
-    return format_json(json_text, indent=2, sort_keys=False, ensure_ascii=False)
+    return format_json(json_text, indent=2, sort_keys=False, ensure_ascii=False, parsed=parsed)
+
+# Available formatting options and their descriptions; treat as read-only
+_FORMATTING_OPTIONS = {
+    "indent": {
+        "description": "Number of spaces for indentation",
+        "options": [0, 2, 4, 8],
+        "default": 2
+    },
+    "sort_keys": {
+        "description": "Sort object keys alphabetically",
+        "options": [True, False],
+        "default": False
+    },
+    "ensure_ascii": {
+        "description": "Escape non-ASCII characters",
+        "options": [True, False],
+        "default": False
+    },
+    "separators": {
+        "description": "Custom separators for items and key-value pairs",
+        "compact": (",", ":"),
+        "pretty": (", ", ": "),
+        "default": (",", ": ")
+    }
+}
 
 def get_formatting_options() -> dict:
     """
     Get available formatting options and their descriptions.
-    
+
     Returns:
-        Dictionary of formatting options
+        Dictionary of formatting options (shared constant - do not mutate)
     """
-    return {
-        "indent": {
-            "description": "Number of spaces for indentation",
-            "options": [0, 2, 4, 8],
-            "default": 2
-        },
-        "sort_keys": {
-            "description": "Sort object keys alphabetically",
-            "options": [True, False],
-            "default": False
-        },
-        "ensure_ascii": {
-            "description": "Escape non-ASCII characters",
-            "options": [True, False],
-            "default": False
-        },
-        "separators": {
-            "description": "Custom separators for items and key-value pairs",
-            "compact": (",", ":"),
-            "pretty": (", ", ": "),
-            "default": (",", ": ")
-        }
-    }
+    return _FORMATTING_OPTIONS
 
 def validate_and_format(
     json_text: str,
@@ -190,9 +382,8 @@ def validate_and_format(
         formatted = format_json(json_text, indent=indent, sort_keys=sort_keys)
         return True, formatted, None
     except json.JSONDecodeError as e:
-        error_msg = f"JSON Syntax Error: {e.msg}"
-        if hasattr(e, 'lineno') and hasattr(e, 'colno'):
-            error_msg += f" (Line {e.lineno}, Column {e.colno})"
+        # lineno/colno are guaranteed attributes of JSONDecodeError
+        error_msg = f"JSON Syntax Error: {e.msg} (Line {e.lineno}, Column {e.colno})"
         if raise_on_error:
             raise
         return False, json_text, error_msg
@@ -213,8 +404,8 @@ def calculate_compression_ratio(original: str, formatted: str) -> dict:
     Returns:
         Dictionary with compression statistics
     """
-    original_size = len(original.encode('utf-8'))
-    formatted_size = len(formatted.encode('utf-8'))
+    original_size = utf8_len(original)
+    formatted_size = utf8_len(formatted)
     
     if original_size == 0:
         return {"error": "Empty original JSON"}
@@ -5,41 +5,113 @@ Utility functions for the Text Tools app.
 import streamlit as st
 import re
 import json
+import zlib
+from collections import deque
 from typing import Any, Optional
 from src.config import Config
 
+# Compiled once: one alternation covering all markdown markers (headers,
+# lists, links, bold/italic, blockquotes, code) instead of 12 patterns;
+# bold comes before single-marker italic so '**' isn't eaten as '*..*'
+_MD_RE = re.compile(
+    r'(?m)(?:^#{1,6}\s|^\*\s|^\d+\.\s|^-\s|\[[^\]]*\]\([^)]*\)'
+    r'|\*\*[^*]+\*\*|__[^_]+__|\*[^*\n]+\*|_[^_\n]+_|^>|```|`[^`]+`)'
+)
+
+# How much content the markdown sniff inspects
+_MD_SNIFF_LINES = 10
+_MD_SNIFF_CHARS = 2048
+
+# Compiled once: one run of non-whitespace = one word
+_WORD_RE = re.compile(r'\S+')
+
+def _first_nonspace(text: str) -> int:
+    """
+    Index of the first non-whitespace character, or -1 if none.
+
+    Early-exits on the first real character, so the common case costs a
+    handful of comparisons instead of the full-document copy .strip()
+    would allocate.
+    """
+    for i, ch in enumerate(text):
+        if not ch.isspace():
+            return i
+    return -1
+
+def has_content(text: str) -> bool:
+    """
+    Check whether text contains any non-whitespace character.
+
+    Drop-in replacement for `bool(text.strip())` emptiness tests that
+    avoids copying the document.
+
+    Args:
+        text: Text to check
+
+    Returns:
+        True if text has at least one non-whitespace character
+    """
+    return _first_nonspace(text) != -1
+
 def sanitize_text(text: str, max_length: int = 1000) -> str:
     """
     Sanitize text input to prevent XSS and limit length.
-    
+
     Args:
         text: Input text to sanitize
         max_length: Maximum allowed length
-    
+
     Returns:
         Sanitized text string
     """
     if not isinstance(text, str):
         return str(text)[:max_length]
-    
-    # Remove potential HTML/script tags
-    sanitized = re.sub(r'<[^>]*>', '', text)
-    
+
+    # Common case: no markup at all, nothing to strip
+    if '<' not in text:
+        return text[:max_length]
+
+    # Bound work on huge inputs - only a prefix can survive the length
+    # cap anyway (x8 leaves room for stripped tags)
+    if len(text) > max_length * 8:
+        text = text[:max_length * 8]
+
+    # Remove potential HTML/script tags by copying the runs between
+    # <...> spans; str.find and slicing stay in C, no regex engine
+    parts = []
+    i = 0
+    length = len(text)
+    while i < length:
+        lt = text.find('<', i)
+        if lt < 0:
+            parts.append(text[i:])
+            break
+        parts.append(text[i:lt])
+        gt = text.find('>', lt + 1)
+        if gt < 0:
+            # No closing '>' means this is not a tag; keep the rest
+            # verbatim, matching the old regex which only stripped
+            # complete <...> spans
+            parts.append(text[lt:])
+            break
+        i = gt + 1
+
     # Limit length
-    return sanitized[:max_length]
+    return ''.join(parts)[:max_length]
 
 def init_session_state() -> None:
     """Initialize Streamlit session state with default values."""
     # Updated session keys for general text editing
     session_keys = {
         'original_text': '',
+        'original_hash': None,  # BLAKE2b fingerprint of original_text
         'edited_text': '',
         'validator_text': '',  # Separate text for validator
         'json_schema': '',
         'use_schema': False,
         'mode': 'Editor',
         'file_type': 'json',  # Track file type (json, txt, md)
-        'undo_stack': [],
+        'undo_stack': deque(maxlen=Config.MAX_UNDO_STACK_SIZE),
         'show_download': False  # Track download interface visibility
     }
     
@@ -50,36 +122,64 @@ def init_session_state() -> None:
 def add_to_undo_stack(content: str) -> None:
     """
     Add content to the undo stack.
-    
+
+    Snapshots are stored as (hash, compressed) pairs in a bounded deque
+    so large documents don't triple the session-state footprint.
+
     Args:
         content: Content to add to undo stack
     """
     if 'undo_stack' not in st.session_state:
-        st.session_state.undo_stack = []
-    
-    # Don't add if it's the same as the current top
-    if (st.session_state.undo_stack and 
-        st.session_state.undo_stack[-1] == content):
+        st.session_state.undo_stack = deque(maxlen=Config.MAX_UNDO_STACK_SIZE)
+
+    # Dedupe on the hash before paying for compression; str hashes are
+    # cached on the object, so repeat pushes of the same text are cheap
+    content_hash = hash(content)
+    if (st.session_state.undo_stack and
+        st.session_state.undo_stack[-1][0] == content_hash):
         return
-    
-    st.session_state.undo_stack.append(content)
-    
-    # Limit stack size
-    if len(st.session_state.undo_stack) > Config.MAX_UNDO_STACK_SIZE:
-        st.session_state.undo_stack.pop(0)
+
+    # The deque's maxlen evicts the oldest entry automatically
+    st.session_state.undo_stack.append(
+        (content_hash, zlib.compress(content.encode('utf-8'), 1)))
+
+def pop_from_undo_stack() -> Optional[str]:
+    """
+    Pop and decompress the most recent undo snapshot.
+
+    Returns:
+        The previous content, or None if the stack is empty
+    """
+    undo_stack = st.session_state.get('undo_stack')
+    if not undo_stack:
+        return None
+    return zlib.decompress(undo_stack.pop()[1]).decode('utf-8')
+
+# Entity-escape table for markup characters in displayed JSON keys;
+# str.translate applies it in a single C-level pass
+_ENTITY_TRANS = str.maketrans({
+    '<': '&lt;',
+    '>': '&gt;',
+    '&': '&amp;',
+    '"': '&quot;',
+    "'": '&#39;'
+})
 
 def safe_json_key(key: Any) -> str:
     """
     Safely convert a JSON key to string for display.
-    
+
+    Markup characters are entity-escaped (rather than stripped) so keys
+    stay readable while remaining safe to render.
+
     Args:
         key: JSON key to convert
-    
+
     Returns:
         Safe string representation of the key
     """
     if isinstance(key, str):
-        return sanitize_text(key, 100)
+        return key.translate(_ENTITY_TRANS)[:100]
     return str(key)[:100]
 
 def truncate_long_value(value: Any, max_length: int = 200) -> str:
@@ -98,48 +198,58 @@ def truncate_long_value(value: Any, max_length: int = 200) -> str:
         return str_value
     return str_value[:max_length] + "..."
 
+# Exact-type dispatch for JSON value icons; type() equality keeps bool
+# (a subclass of int) out of the numeric bucket
+_TYPE_ICONS = {
+    dict: "📁",
+    list: "📋",
+    str: "📝",
+    int: "🔢",
+    float: "🔢",
+    type(None): "∅"
+}
+
 def get_json_type_icon(value: Any) -> str:
     """
     Get an appropriate icon for a JSON value type.
-    
+
     Args:
         value: JSON value
-    
+
     Returns:
         Icon string for the value type
     """
-    if isinstance(value, dict):
-        return "📁"
-    elif isinstance(value, list):
-        return "📋"
-    elif isinstance(value, str):
-        return "📝"
-    elif isinstance(value, (int, float)):
-        return "🔢"
-    elif isinstance(value, bool):
+    value_type = type(value)
+    if value_type is bool:
         return "☑️" if value else "☐"
-    elif value is None:
-        return "∅"
-    else:
-        return "❓"
+    return _TYPE_ICONS.get(value_type, "❓")
+
+# File-type icons; keys are lowercase so the common already-lowercase
+# lookup needs no .lower() call
+_FILE_TYPE_ICONS = {
+    'json': '📋',
+    'txt': '📄',
+    'md': '📝',
+    'markdown': '📝'
+}
+
+# Extensions detect_file_type recognizes from a filename
+_KNOWN_EXTS = {'json', 'txt', 'md', 'markdown'}
 
 def get_file_type_icon(file_type: str) -> str:
     """
     Get an appropriate icon for a file type.
-    
+
     Args:
         file_type: File extension/type
-    
+
     Returns:
         Icon string for the file type
     """
-    icons = {
-        'json': '📋',
-        'txt': '📄',
-        'md': '📝',
-        'markdown': '📝'
-    }
-    return icons.get(file_type.lower(), '📄')
+    icon = _FILE_TYPE_ICONS.get(file_type)
+    if icon is not None:
+        return icon
+    return _FILE_TYPE_ICONS.get(file_type.lower(), '📄')
 
 def format_file_size(size_bytes: int) -> str:
     """
@@ -158,17 +268,34 @@ def format_file_size(size_bytes: int) -> str:
     else:
         return f"{size_bytes / (1024 * 1024):.1f} MB"
 
+def utf8_len(text: str) -> int:
+    """
+    UTF-8 byte length of text.
+
+    Pure-ASCII strings (the common case) are measured without
+    materializing an encoded copy.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Length in UTF-8 bytes
+    """
+    if text.isascii():
+        return len(text)
+    return len(text.encode('utf-8'))
+
 def is_large_file(content: str) -> bool:
     """
     Check if content is considered large.
-    
+
     Args:
         content: Text content to check
-    
+
     Returns:
         True if content is large
     """
-    return len(content.encode('utf-8')) > Config.MAX_FILE_SIZE_BYTES
+    return utf8_len(content) > Config.MAX_FILE_SIZE_BYTES
 
 def detect_file_type(content: str, filename: str = None) -> str:
     """
@@ -183,54 +310,38 @@ def detect_file_type(content: str, filename: str = None) -> str:
     """
     # Check filename extension first
     if filename:
-        ext = filename.split('.')[-1].lower()
-        if ext in ['json', 'txt', 'md', 'markdown']:
+        ext = filename.rpartition('.')[2].lower()
+        if ext in _KNOWN_EXTS:
             return 'md' if ext == 'markdown' else ext
     
-    # Try to detect from content
-    if not content or not content.strip():
+    # Try to detect from content; locate the first real character instead
+    # of stripping (which would copy the whole document)
+    start = _first_nonspace(content) if content else -1
+    if start < 0:
         return 'txt'
-        
-    content = content.strip()
-    
+
     # Check if it's JSON - more robust detection
-    if content.startswith(('{', '[')):
+    if content[start] in '{[':
         try:
             json.loads(content)
             return 'json'
         except:
             pass
-    
-    # Check if it's Markdown - look for common markdown patterns
-    markdown_patterns = [
-        r'^#{1,6}\s',  # Headers
-        r'^\*\s',      # Unordered lists
-        r'^\d+\.\s',   # Ordered lists
-        r'^\-\s',      # Unordered lists with dash
-        r'\[.*\]\(.*\)', # Links
-        r'\*\*.*\*\*', # Bold
-        r'\_\_.*\_\_', # Bold
-        r'\*.*\*',     # Italic
-        r'\_.*\_',     # Italic
-        r'^>',         # Blockquotes
-        r'```',        # Code blocks
-        r'`.*`'        # Inline code
-    ]
-    
-    # Check multiple lines for markdown patterns
-    lines = content.split('\n')
-    markdown_score = 0
-    
-    for line in lines[:10]:  # Check first 10 lines
-        for pattern in markdown_patterns:
-            if re.search(pattern, line, re.MULTILINE):
-                markdown_score += 1
-                break
-    
+
+    # Check if it's Markdown - single pass of the combined pattern over a
+    # bounded prefix instead of 12 regex searches per line; slicing the
+    # prefix first bounds every allocation to the sniff window
+    head = content[start:start + _MD_SNIFF_CHARS]
+    head = '\n'.join(head.split('\n', _MD_SNIFF_LINES)[:_MD_SNIFF_LINES])
+    checked_lines = head.count('\n') + 1
+
+    # Count distinct lines containing a markdown marker
+    hit_lines = {head.count('\n', 0, m.start()) for m in _MD_RE.finditer(head)}
+
     # If we found markdown patterns in more than 20% of checked lines, it's probably markdown
-    if markdown_score > len(lines[:10]) * 0.2:
+    if len(hit_lines) > checked_lines * 0.2:
         return 'md'
-    
+
     # Default to txt
     return 'txt'
 
@@ -246,21 +357,23 @@ def count_words(text: str) -> int:
     """
     if not text:
         return 0
-    return len(text.split())
+    # Count matches without materializing the word list split() would build
+    return sum(1 for _ in _WORD_RE.finditer(text))
 
 def count_lines(text: str) -> int:
     """
     Count lines in text.
-    
+
     Args:
         text: Text to count lines in
-    
+
     Returns:
         Number of lines
     """
     if not text:
         return 0
-    return len(text.splitlines())
+    # Newline count instead of allocating the splitlines() list
+    return text.count('\n') + (0 if text.endswith('\n') else 1)
 
 def count_paragraphs(text: str) -> int:
     """
@@ -274,7 +387,25 @@ def count_paragraphs(text: str) -> int:
     """
     if not text:
         return 0
-    return len([p for p in text.split('\n\n') if p.strip()])
+
+    # Scan with str.find instead of split('\n\n'), which would allocate a
+    # copy of every paragraph; each block only needs its first
+    # non-whitespace character located to count as a paragraph
+    count = 0
+    i = 0
+    length = len(text)
+    while i < length:
+        sep = text.find('\n\n', i)
+        end = length if sep < 0 else sep
+        j = i
+        while j < end and text[j].isspace():
+            j += 1
+        if j < end:
+            count += 1
+        if sep < 0:
+            break
+        i = sep + 2
+    return count
 
 def get_text_stats(text: str) -> dict:
     """
@@ -296,8 +427,8 @@ def get_text_stats(text: str) -> dict:
             'kb': 0.0
         }
     
-    bytes_count = len(text.encode('utf-8'))
-    
+    bytes_count = utf8_len(text)
+
     return {
         'characters': len(text),
         'words': count_words(text),
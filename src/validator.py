@@ -3,92 +3,167 @@ JSON validation functions for syntax and schema validation.
 Enhanced with detailed error reporting including line numbers and context.
 """
 
+import functools
 import json
 import jsonschema
 from typing import List, Dict, Tuple, Any, Optional
 import re
+from src.utils import utf8_len, has_content
 
-# Try to import ijson for streaming large files
+# Try to import ijson for streaming large files, preferring its C backend
 try:
     import ijson
+    try:
+        from ijson.backends import yajl2_c as ijson_backend
+    except ImportError:
+        ijson_backend = ijson
     IJSON_AVAILABLE = True
 except ImportError:
     IJSON_AVAILABLE = False
 
+# Try to import orjson for native-speed validation, fall back to stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Below this size stdlib json is just as fast and its error positions are
+# battle-tested; orjson only pays off on larger documents
+_ORJSON_MIN_CHARS = 1024
+
 def validate_json(json_text: str) -> Tuple[bool, List[str]]:
     """
     Validate JSON syntax and return detailed error information.
-    
+
     Args:
         json_text: JSON string to validate
-    
+
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
-    if not json_text.strip():
-        return False, ["Empty JSON input"]
-    
+    is_valid, errors, _ = validate_json_parsed(json_text)
+    return is_valid, errors
+
+def validate_json_parsed(json_text: str) -> Tuple[bool, List[str], Optional[Any]]:
+    """
+    Validate JSON syntax and also return the parsed object.
+
+    Callers that need the data after a successful validation (schema
+    checks, formatting) can reuse it instead of parsing twice. The
+    parsed object is only returned when it came from stdlib json; a
+    None alongside is_valid=True means the caller should parse itself.
+
+    Args:
+        json_text: JSON string to validate
+
+    Returns:
+        Tuple of (is_valid, list_of_errors, parsed_object_or_None)
+    """
+    if not has_content(json_text):
+        return False, ["Empty JSON input"], None
+
     try:
-        json.loads(json_text)
-        return True, []
+        # orjson parses large documents roughly twice as fast, but it
+        # reads integers outside the 64-bit range as floats, so it is
+        # strictly an accept fast path: the object it builds is discarded
+        # and callers that need the data reparse with stdlib. Its
+        # rejections are only a hint too - orjson refuses NaN/Infinity,
+        # which stdlib accepts - so on failure the stdlib parse below is
+        # the authority and supplies the error positions
+        if ORJSON_AVAILABLE and len(json_text) >= _ORJSON_MIN_CHARS:
+            try:
+                orjson.loads(json_text)
+                return True, [], None
+            except json.JSONDecodeError:
+                pass
+        return True, [], json.loads(json_text)
     except json.JSONDecodeError as e:
         # Create detailed error message with context
         detailed_error = _create_detailed_error_message(json_text, e)
-        return False, [detailed_error]
+        return False, [detailed_error], None
     except Exception as e:
-        return False, [f"Unexpected error: {str(e)}"]
+        return False, [f"Unexpected error: {str(e)}"], None
+
+def _nearby_lines(json_text: str, pos: int, context: int = 1) -> Tuple[int, List[str]]:
+    """
+    Extract the lines around a character position without splitting
+    the whole document.
+
+    Args:
+        json_text: Full JSON text
+        pos: Character position of interest
+        context: Number of lines to include on each side
+
+    Returns:
+        Tuple of (lines_before_target, list_of_lines)
+    """
+    pos = min(max(pos, 0), len(json_text))
+
+    # Start of the line containing pos, then walk back `context` lines
+    start = json_text.rfind('\n', 0, pos) + 1
+    lines_before = 0
+    for _ in range(context):
+        if start == 0:
+            break
+        start = json_text.rfind('\n', 0, start - 1) + 1
+        lines_before += 1
+
+    # Walk forward past the target line plus `context` lines
+    end = pos
+    for _ in range(context + 1):
+        nxt = json_text.find('\n', end)
+        if nxt < 0:
+            end = len(json_text)
+            break
+        end = nxt + 1
+
+    return lines_before, json_text[start:end].rstrip('\n').split('\n')
 
 def _create_detailed_error_message(json_text: str, error: json.JSONDecodeError) -> str:
     """
     Create a detailed error message with line context and visual indicators.
-    
+
     Args:
         json_text: Original JSON text
         error: JSONDecodeError object
-    
+
     Returns:
         Formatted error message with context
     """
-    lines = json_text.splitlines()
-    line_num = getattr(error, 'lineno', 1)
-    col_num = getattr(error, 'colno', 1)
-    
+    # lineno/colno/pos are guaranteed attributes of JSONDecodeError
+    line_num = error.lineno
+    col_num = error.colno
+
     # Build the error message
     error_msg = f"Error: Parse error on line {line_num}:\n"
-    
-    # Add context lines (show 1 line before and after if possible)
+
+    # Add context lines (show 1 line before and after if possible),
+    # slicing only the needed region instead of splitting the document
+    lines_before, nearby = _nearby_lines(json_text, error.pos)
+
+    # Build, truncate and emptiness-check the context lines in one pass
+    # instead of joining, re-splitting and re-joining
     context_lines = []
-    start_line = max(0, line_num - 2)
-    end_line = min(len(lines), line_num + 1)
-    
-    for i in range(start_line, end_line):
-        line_content = lines[i] if i < len(lines) else ""
-        line_number = i + 1
-        
+    for offset, line_content in enumerate(nearby):
+        line_number = line_num - lines_before + offset
+
+        # Truncate very long lines for readability
+        if len(line_content) > 100:
+            line_content = line_content[:97] + "..."
+        context_lines.append(line_content)
+
         if line_number == line_num:
-            # This is the error line - add visual indicator
-            context_lines.append(f"{line_content}")
-            
-            # Add pointer to exact error position
-            pointer_line = "-" * (col_num - 1) + "^"
-            context_lines.append(pointer_line)
-        else:
-            context_lines.append(f"{line_content}")
-    
-    # Join context lines
-    context = "\n".join(context_lines)
-    
+            # This is the error line - add pointer to exact error position
+            pointer = f"{'-' * (col_num - 1)}^"
+            if len(pointer) > 100:
+                pointer = pointer[:97] + "..."
+            context_lines.append(pointer)
+
     # Add the context to error message
-    if context.strip():
-        # Truncate very long lines for readability
-        context_lines_truncated = []
-        for line in context.split('\n'):
-            if len(line) > 100:
-                line = line[:97] + "..."
-            context_lines_truncated.append(line)
-        context = "\n".join(context_lines_truncated)
-        error_msg += f"...{context}\n"
-    
+    if any(map(has_content, context_lines)):
+        error_msg += "..." + "\n".join(context_lines) + "\n"
+
     # Add specific error description
     error_description = _get_error_description(error)
     error_msg += f"{error_description}"
@@ -132,61 +207,98 @@ def _get_error_description(error: json.JSONDecodeError) -> str:
         else:
             return f"JSON syntax error: {error.msg}"
 
-def validate_against_schema(json_text: str, schema_text: str) -> List[Dict[str, str]]:
+def validate_against_schema(
+    json_text: str,
+    schema_text: str,
+    parsed: Optional[Any] = None
+) -> List[Dict[str, str]]:
     """
     Validate JSON against a JSON Schema.
-    
+
     Args:
         json_text: JSON string to validate
         schema_text: JSON Schema string
-    
+        parsed: Optional pre-parsed data; when given, json_text is not reparsed
+
     Returns:
         List of validation errors with path and message
     """
     errors = []
-    
-    try:
-        # Parse JSON data
-        json_data = json.loads(json_text)
-    except json.JSONDecodeError as e:
-        return [{"path": "root", "message": f"Invalid JSON: {e.msg}"}]
-    
+
+    if parsed is not None:
+        json_data = parsed
+    else:
+        try:
+            # Parse JSON data
+            json_data = json.loads(json_text)
+        except json.JSONDecodeError as e:
+            return [{"path": "root", "message": f"Invalid JSON: {e.msg}"}]
+
     try:
-        # Parse schema
-        schema = json.loads(schema_text)
+        # Compiled once per schema text; repeat validations against the
+        # same schema skip parsing and meta-schema resolution entirely
+        validator = _compile_schema(schema_text)
     except json.JSONDecodeError as e:
         return [{"path": "schema", "message": f"Invalid schema: {e.msg}"}]
-    
-    try:
-        # Validate against schema
-        jsonschema.validate(json_data, schema)
-        return []  # No errors
-    except jsonschema.ValidationError as e:
-        # Convert validation error to our format
-        error_path = _format_json_path(e.absolute_path)
-        errors.append({
-            "path": error_path,
-            "message": e.message
-        })
-        return errors
     except jsonschema.SchemaError as e:
         return [{"path": "schema", "message": f"Invalid schema: {e.message}"}]
+
+    try:
+        # iter_errors is lazy, so valid documents cost a single walk and
+        # pathological inputs can't produce unbounded error lists
+        for error in validator.iter_errors(json_data):
+            errors.append({
+                "path": _format_json_path(error.absolute_path),
+                "message": error.message
+            })
+            if len(errors) >= _MAX_SCHEMA_ERRORS:
+                break
+        return errors
     except Exception as e:
         return [{"path": "unknown", "message": f"Validation error: {str(e)}"}]
 
-def validate_large_json(json_text: str, max_size_mb: int = 5) -> Tuple[bool, List[str]]:
+# Bound on errors reported from a single schema validation
+_MAX_SCHEMA_ERRORS = 50
+
+@functools.lru_cache(maxsize=16)
+def _compile_schema(schema_text: str) -> Any:
+    """
+    Parse a schema and build its draft-appropriate validator once.
+
+    Building the validator resolves the meta-schema and reference tree,
+    which dominates schema-validation cost; caching by schema text makes
+    repeat validations against the same schema nearly free.
+
+    Args:
+        schema_text: JSON Schema as a string
+
+    Returns:
+        A compiled jsonschema validator instance
+
+    Raises:
+        json.JSONDecodeError: If the schema text is not valid JSON
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    schema = json.loads(schema_text)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+def validate_large_json(json_text: str, max_size_mb: int = 5, size_bytes: Optional[int] = None) -> Tuple[bool, List[str]]:
     """
     Validate large JSON files using streaming parser if available.
-    
+
     Args:
         json_text: JSON string to validate
         max_size_mb: Maximum size in MB before using streaming
-    
+        size_bytes: Optional precomputed byte length to avoid re-measuring
+
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
     # Check size
-    size_bytes = len(json_text.encode('utf-8'))
+    if size_bytes is None:
+        size_bytes = utf8_len(json_text)
     size_mb = size_bytes / (1024 * 1024)
     
     if size_mb <= max_size_mb or not IJSON_AVAILABLE:
@@ -196,11 +308,11 @@ def validate_large_json(json_text: str, max_size_mb: int = 5) -> Tuple[bool, Lis
     # Use streaming validation for large files
     try:
         import io
-        json_stream = io.StringIO(json_text)
-        
-        # Try to parse using ijson streaming parser
+
+        # Feed encoded bytes to the (C-backed) parser and just drain the
+        # event stream; no DOM is materialized and errors surface mid-stream
         try:
-            parser = ijson.parse(json_stream)
+            parser = ijson_backend.parse(io.BytesIO(json_text.encode('utf-8')))
             for _ in parser:
                 pass  # Just iterate through to check for errors
             return True, []
@@ -208,7 +320,7 @@ def validate_large_json(json_text: str, max_size_mb: int = 5) -> Tuple[bool, Lis
             return False, [f"Large JSON parsing error: {str(e)}"]
         except Exception as e:
             return False, [f"Streaming validation failed: {str(e)}"]
-    
+
     except Exception:
         # Fall back to regular validation if streaming fails
         return validate_json(json_text)
@@ -284,13 +396,14 @@ def get_validation_summary(json_text: str, schema_text: Optional[str] = None) ->
         "recommendations": []
     }
     
-    # Syntax validation
-    is_valid, errors = validate_json(json_text)
+    # Syntax validation; keep the parsed object (when the stdlib built
+    # one) so a schema check below doesn't parse the same text twice
+    is_valid, errors, parsed = validate_json_parsed(json_text)
     summary["syntax_valid"] = is_valid
     summary["syntax_errors"] = errors
     
     # Size information
-    size_bytes = len(json_text.encode('utf-8'))
+    size_bytes = utf8_len(json_text)
     summary["size_info"] = {
         "bytes": size_bytes,
         "kb": size_bytes / 1024,
@@ -300,7 +413,7 @@ def get_validation_summary(json_text: str, schema_text: Optional[str] = None) ->
     
     # Schema validation if provided
     if schema_text and is_valid:
-        schema_errors = validate_against_schema(json_text, schema_text)
+        schema_errors = validate_against_schema(json_text, schema_text, parsed=parsed)
         summary["schema_valid"] = len(schema_errors) == 0
         summary["schema_errors"] = schema_errors
     
@@ -1,348 +1,601 @@
-"""
-JSON tree viewer with expandable/collapsible structure for Text Tools.
-"""
-
-import streamlit as st
-import json
-from typing import Any, Dict, List, Union
-from src.config import Config
-from src.utils import get_json_type_icon, truncate_long_value, safe_json_key
-
-def render_json_tree(
-    data: Any,
-    max_depth: int = Config.MAX_RECURSION_DEPTH,
-    current_depth: int = 0,
-    key_path: str = "root"
-) -> None:
-    """
-    Render JSON data as an expandable tree structure.
-    
-    Args:
-        data: JSON data to render
-        max_depth: Maximum recursion depth
-        current_depth: Current recursion level
-        key_path: Current path in the JSON structure
-    """
-    if current_depth > max_depth:
-        st.warning(f"⚠️ Maximum depth ({max_depth}) reached at {key_path}")
-        return
-    
-    _render_json_node(data, current_depth, key_path, max_depth)
-
-def _render_json_node(
-    data: Any,
-    depth: int,
-    path: str,
-    max_depth: int
-) -> None:
-    """Render a single JSON node."""
-    if isinstance(data, dict):
-        _render_dict_node(data, depth, path, max_depth)
-    elif isinstance(data, list):
-        _render_list_node(data, depth, path, max_depth)
-    else:
-        _render_value_node(data, path)
-
-def _render_dict_node(
-    data: Dict[str, Any],
-    depth: int,
-    path: str,
-    max_depth: int
-) -> None:
-    """Render a dictionary node with expandable structure."""
-    if not data:
-        st.write("📁 {} (empty object)".format(path.split('.')[-1]))
-        return
-    
-    # Create expandable section for the dictionary
-    section_key = f"dict_{path}_{depth}"
-    with st.expander(
-        f"📁 {path.split('.')[-1]} ({len(data)} keys)",
-        expanded=(depth < 2)
-    ):
-        # Sort keys if requested or show in original order
-        keys = list(data.keys())
-        for key in keys:
-            safe_key = safe_json_key(key)
-            child_path = f"{path}.{safe_key}" if path != "root" else safe_key
-            
-            # Create columns for key-value layout
-            col1, col2 = st.columns([1, 3])
-            
-            with col1:
-                st.write(f"**{safe_key}:**")
-            
-            with col2:
-                if depth + 1 <= max_depth:
-                    _render_json_node(data[key], depth + 1, child_path, max_depth)
-                else:
-                    st.write("...")
-
-def _render_list_node(
-    data: List[Any],
-    depth: int,
-    path: str,
-    max_depth: int
-) -> None:
-    """Render a list node with expandable structure."""
-    if not data:
-        st.write("📋 {} (empty array)".format(path.split('.')[-1]))
-        return
-    
-    # Create expandable section for the list
-    with st.expander(
-        f"📋 {path.split('.')[-1]} ({len(data)} items)",
-        expanded=(depth < 2)
-    ):
-        for i, item in enumerate(data):
-            child_path = f"{path}[{i}]"
-            
-            # Create columns for index-value layout
-            col1, col2 = st.columns([1, 3])
-            
-            with col1:
-                st.write(f"**[{i}]:**")
-            
-            with col2:
-                if depth + 1 <= max_depth:
-                    _render_json_node(item, depth + 1, child_path, max_depth)
-                else:
-                    st.write("...")
-            
-            # Limit number of items shown in very large arrays
-            if i >= 99:  # Show max 100 items
-                st.write(f"... and {len(data) - 100} more items")
-                break
-
-def _render_value_node(data: Any, path: str) -> None:
-    """Render a primitive value node."""
-    icon = get_json_type_icon(data)
-    type_name = type(data).__name__
-    
-    if isinstance(data, str):
-        # Handle long strings
-        display_value = truncate_long_value(data, 100)
-        if len(display_value) < len(data):
-            # Show full string in expandable section
-            with st.expander(f'{icon} "{display_value}" (string, {len(data)} chars)'):
-                st.code(data, language="text")
-        else:
-            st.write(f'{icon} "{display_value}" ({type_name})')
-    
-    elif isinstance(data, bool):
-        st.write(f"{icon} {str(data).lower()} ({type_name})")
-    
-    elif isinstance(data, (int, float)):
-        st.write(f"{icon} {data} ({type_name})")
-    
-    elif data is None:
-        st.write(f"{icon} null")
-    
-    else:
-        # Handle other types
-        display_value = truncate_long_value(str(data), 100)
-        st.write(f"{icon} {display_value} ({type_name})")
-
-def render_json_summary(data: Any) -> None:
-    """
-    Render a summary of the JSON structure.
-    
-    Args:
-        data: Parsed JSON data
-    """
-    summary = analyze_json_structure(data)
-    
-    st.subheader("📊 JSON Summary")
-    
-    # Basic stats
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Total Keys", summary["total_keys"])
-    
-    with col2:
-        st.metric("Max Depth", summary["max_depth"])
-    
-    with col3:
-        st.metric("Array Items", summary["total_array_items"])
-    
-    with col4:
-        st.metric("Null Values", summary["null_count"])
-    
-    # Type distribution
-    if summary["type_distribution"]:
-        st.subheader("🏷️ Type Distribution")
-        for type_name, count in summary["type_distribution"].items():
-            st.write(f"- **{type_name}**: {count}")
-
-def analyze_json_structure(data: Any, current_depth: int = 0) -> Dict[str, Any]:
-    """
-    Analyze JSON structure and return statistics.
-    
-    Args:
-        data: JSON data to analyze
-        current_depth: Current recursion depth
-    
-    Returns:
-        Dictionary with structure analysis
-    """
-    analysis = {
-        "total_keys": 0,
-        "max_depth": current_depth,
-        "total_array_items": 0,
-        "null_count": 0,
-        "type_distribution": {}
-    }
-    
-    def _count_type(value: Any):
-        """Count value types."""
-        type_name = type(value).__name__
-        if value is None:
-            type_name = "null"
-        analysis["type_distribution"][type_name] = (
-            analysis["type_distribution"].get(type_name, 0) + 1
-        )
-        
-        if value is None:
-            analysis["null_count"] += 1
-    
-    def _analyze_recursive(obj: Any, depth: int):
-        """Recursively analyze structure."""
-        analysis["max_depth"] = max(analysis["max_depth"], depth)
-        
-        if isinstance(obj, dict):
-            analysis["total_keys"] += len(obj)
-            _count_type(obj)
-            for value in obj.values():
-                _analyze_recursive(value, depth + 1)
-        elif isinstance(obj, list):
-            analysis["total_array_items"] += len(obj)
-            _count_type(obj)
-            for item in obj:
-                _analyze_recursive(item, depth + 1)
-        else:
-            _count_type(obj)
-    
-    _analyze_recursive(data, current_depth)
-    return analysis
-
-def render_json_path_explorer(data: Any) -> None:
-    """
-    Render a path explorer for navigating JSON structure.
-    
-    Args:
-        data: Parsed JSON data
-    """
-    st.subheader("🗺️ Path Explorer")
-    
-    paths = extract_all_paths(data)
-    if not paths:
-        st.info("No paths found in JSON structure.")
-        return
-    
-    # Path selector
-    selected_path = st.selectbox(
-        "Select a path to explore:",
-        paths,
-        help="Choose a JSON path to see its value"
-    )
-    
-    if selected_path:
-        try:
-            value = get_value_at_path(data, selected_path)
-            st.write(f"**Path:** `{selected_path}`")
-            st.write("**Value:**")
-            if isinstance(value, (dict, list)):
-                st.json(value)
-            else:
-                st.code(str(value))
-        except Exception as e:
-            st.error(f"Error accessing path: {str(e)}")
-
-def extract_all_paths(data: Any, current_path: str = "") -> List[str]:
-    """
-    Extract all possible paths from JSON data.
-    
-    Args:
-        data: JSON data
-        current_path: Current path string
-    
-    Returns:
-        List of all paths in the JSON
-    """
-    paths = []
-    
-    if isinstance(data, dict):
-        for key, value in data.items():
-            new_path = f"{current_path}.{key}" if current_path else key
-            paths.append(new_path)
-            if isinstance(value, (dict, list)):
-                paths.extend(extract_all_paths(value, new_path))
-    
-    elif isinstance(data, list):
-        for i, item in enumerate(data):
-            new_path = f"{current_path}[{i}]"
-            paths.append(new_path)
-            if isinstance(item, (dict, list)):
-                paths.extend(extract_all_paths(item, new_path))
-    
-    return paths
-
-def get_value_at_path(data: Any, path: str) -> Any:
-    """
-    Get value at a specific JSON path.
-    
-    Args:
-        data: JSON data
-        path: Path string (e.g., "user.profile.name" or "items[0].id")
-    
-    Returns:
-        Value at the specified path
-    
-    Raises:
-        KeyError: If path doesn't exist
-        IndexError: If array index is out of range
-    """
-    if not path:
-        return data
-    
-    current = data
-    
-    # Split path into components
-    parts = []
-    current_part = ""
-    i = 0
-    
-    while i < len(path):
-        if path[i] == '.':
-            if current_part:
-                parts.append(current_part)
-                current_part = ""
-        elif path[i] == '[':
-            if current_part:
-                parts.append(current_part)
-                current_part = ""
-            # Find the closing bracket
-            j = i + 1
-            while j < len(path) and path[j] != ']':
-                j += 1
-            if j < len(path):
-                parts.append(int(path[i+1:j]))
-                i = j
-            else:
-                raise ValueError(f"Unclosed bracket in path: {path}")
-        else:
-            current_part += path[i]
-        i += 1
-    
-    if current_part:
-        parts.append(current_part)
-    
-    # Navigate through the path
-    for part in parts:
-        if isinstance(part, int):
-            current = current[part]
-        else:
-            current = current[part]
-    
-    return current
\ No newline at end of file
+"""
+JSON tree viewer with expandable/collapsible structure for Text Tools.
+"""
+
+import streamlit as st
+import functools
+import itertools
+import json
+import re
+import sys
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Tuple, Union
+from src.config import Config
+from src.utils import get_json_type_icon, truncate_long_value, safe_json_key
+
+def walk_json(data: Any) -> Iterator[Tuple[str, Any, int]]:
+    """
+    Walk a JSON tree in document order, yielding (path, value, depth).
+
+    Uses an explicit stack instead of recursion, so one traversal engine
+    serves path extraction and structure analysis without per-node
+    Python frames or a recursion-depth ceiling. The root itself is not
+    yielded; top-level children are at depth 1.
+
+    Args:
+        data: Parsed JSON data to walk
+
+    Yields:
+        (path, value, depth) for every node below the root
+    """
+    # Paths are carried as tuples of segments and joined only when
+    # emitted; dict segments are interned since JSON arrays typically
+    # repeat the same schema keys, so siblings share segment storage
+    stack = [((), data, 0)]
+    while stack:
+        parts, obj, depth = stack.pop()
+        if parts:
+            yield ''.join(parts), obj, depth
+
+        # Push children in reverse so they pop in document order
+        if isinstance(obj, dict):
+            top = not parts
+            stack.extend(
+                (parts + (sys.intern(f"{key}" if top else f".{key}"),), value, depth + 1)
+                for key, value in reversed(obj.items())
+            )
+        elif isinstance(obj, list):
+            stack.extend(
+                (parts + (f"[{i}]",), obj[i], depth + 1)
+                for i in reversed(range(len(obj)))
+            )
+
+def render_json_tree(
+    data: Any,
+    max_depth: int = Config.MAX_RECURSION_DEPTH,
+    current_depth: int = 0,
+    key_path: str = "root"
+) -> None:
+    """
+    Render JSON data as an expandable tree structure.
+    
+    Args:
+        data: JSON data to render
+        max_depth: Maximum recursion depth
+        current_depth: Current recursion level
+        key_path: Current path in the JSON structure
+    """
+    if current_depth > max_depth:
+        st.warning(f"⚠️ Maximum depth ({max_depth}) reached at {key_path}")
+        return
+
+    # The display label is the last path segment; computed once here so
+    # the render helpers never re-split the full path per node
+    _render_json_node(data, current_depth, key_path, key_path.rpartition('.')[2], max_depth)
+
+def _render_json_node(
+    data: Any,
+    depth: int,
+    path: str,
+    label: str,
+    max_depth: int
+) -> None:
+    """Render a single JSON node under its display label."""
+    if isinstance(data, dict):
+        _render_dict_node(data, depth, path, label, max_depth)
+    elif isinstance(data, list):
+        _render_list_node(data, depth, path, label, max_depth)
+    else:
+        _render_value_node(data, path)
+
+def _render_dict_node(
+    data: Dict[str, Any],
+    depth: int,
+    path: str,
+    label: str,
+    max_depth: int
+) -> None:
+    """Render a dictionary node with expandable structure."""
+    if not data:
+        st.write(f"📁 {label} (empty object)")
+        return
+
+    # Children would all exceed max depth: say so once instead of
+    # re-checking (and bailing) per key inside the loop
+    if depth + 1 > max_depth:
+        st.write(f"📁 {label} ({len(data)} keys, truncated)")
+        return
+
+    # Create expandable section for the dictionary
+    section_key = f"dict_{path}_{depth}"
+    with st.expander(
+        f"📁 {label} ({len(data)} keys)",
+        expanded=(depth < 2)
+    ):
+        # Streamlit renders expander bodies even when collapsed, so deep
+        # sections gate their children behind a session-state toggle:
+        # until the user asks, a collapsed subtree costs O(1)
+        if depth >= 2 and not st.checkbox(
+            f"Load {len(data)} keys", key=section_key
+        ):
+            return
+
+        # Partition children: primitive values collapse into one markdown
+        # table (a single widget instead of two layout columns per key);
+        # only containers need the recursive expander path. Iterating
+        # items() avoids materializing the key list and re-looking every
+        # value up by key
+        primitives = []
+        containers = []
+        for key, value in data.items():
+            if isinstance(value, (dict, list)):
+                containers.append((key, value))
+            else:
+                primitives.append((key, value))
+
+        if primitives:
+            rows = ["| Key | Value |", "| --- | --- |"]
+            for key, value in primitives:
+                rows.append(
+                    f"| **{_table_key(key)}** | "
+                    f"{get_json_type_icon(value)} {_table_cell(value)} |"
+                )
+            st.markdown("\n".join(rows))
+
+        for key, value in containers:
+            safe_key = safe_json_key(key)
+            child_path = f"{path}.{safe_key}" if path != "root" else safe_key
+            _render_json_node(value, depth + 1, child_path, safe_key, max_depth)
+
+def _render_list_node(
+    data: List[Any],
+    depth: int,
+    path: str,
+    label: str,
+    max_depth: int
+) -> None:
+    """Render a list node with expandable structure."""
+    if not data:
+        st.write(f"📋 {label} (empty array)")
+        return
+
+    # Same hoisted depth check as the dict renderer
+    if depth + 1 > max_depth:
+        st.write(f"📋 {label} ({len(data)} items, truncated)")
+        return
+
+    # Create expandable section for the list
+    section_key = f"list_{path}_{depth}"
+    with st.expander(
+        f"📋 {label} ({len(data)} items)",
+        expanded=(depth < 2)
+    ):
+        # Same lazy gate as the dict renderer: deep collapsed sections
+        # skip their children until explicitly loaded
+        if depth >= 2 and not st.checkbox(
+            f"Load {len(data)} items", key=section_key
+        ):
+            return
+
+        # All-primitive arrays go to st.dataframe: the grid virtualizes
+        # rows in the frontend, so one widget replaces N markdown rows
+        # and there is no 100-item cap
+        if all(not isinstance(item, (dict, list)) for item in data):
+            import pandas as pd
+
+            st.dataframe(
+                pd.DataFrame({'index': range(len(data)), 'value': data}),
+                use_container_width=True
+            )
+            return
+
+        # Same partition as the dict renderer: primitive items become one
+        # markdown table, containers keep the recursive path
+        primitives = [(i, v) for i, v in enumerate(data) if not isinstance(v, (dict, list))]
+        containers = [(i, v) for i, v in enumerate(data) if isinstance(v, (dict, list))]
+
+        if primitives:
+            rows = ["| Index | Value |", "| --- | --- |"]
+            for i, item in primitives[:100]:
+                rows.append(
+                    f"| **[{i}]** | {get_json_type_icon(item)} {_table_cell(item)} |"
+                )
+            if len(primitives) > 100:
+                rows.append(f"| ... | and {len(primitives) - 100} more items |")
+            st.markdown("\n".join(rows))
+
+        for shown, (i, item) in enumerate(containers):
+            child_path = f"{path}[{i}]"
+            _render_json_node(item, depth + 1, child_path, f"[{i}]", max_depth)
+
+            # Limit number of items shown in very large arrays
+            if shown >= 99:  # Show max 100 items
+                st.write(f"... and {len(containers) - 100} more items")
+                break
+
+def _table_cell(value: Any) -> str:
+    """Render a primitive value as a one-line markdown table cell."""
+    text = truncate_long_value(value, 100)
+    return text.replace('|', '\\|').replace('\n', ' ')
+
+def _table_key(key: Any) -> str:
+    """
+    Render a dict key as a one-line markdown table cell.
+
+    Keys need the same pipe/newline escaping as value cells on top of
+    safe_json_key's entity escaping, or a hostile key breaks its row.
+    """
+    return safe_json_key(key).replace('|', '\\|').replace('\n', ' ')
+
+def _render_str_value(data: str, path: str) -> None:
+    """Render a string value, expanding long ones."""
+    display_value = truncate_long_value(data, 100)
+    if len(display_value) < len(data):
+        # Show full string in expandable section
+        with st.expander(f'📝 "{display_value}" (string, {len(data)} chars)'):
+            st.code(data, language="text")
+    else:
+        st.write(f'📝 "{display_value}" (str)')
+
+def _render_bool_value(data: bool, path: str) -> None:
+    """Render a boolean value."""
+    st.write(f"{'☑️' if data else '☐'} {str(data).lower()} (bool)")
+
+def _render_number_value(data: Union[int, float], path: str) -> None:
+    """Render a numeric value."""
+    st.write(f"🔢 {data} ({type(data).__name__})")
+
+def _render_null_value(data: None, path: str) -> None:
+    """Render a null value."""
+    st.write("∅ null")
+
+def _render_default_value(data: Any, path: str) -> None:
+    """Render a value of any other type."""
+    display_value = truncate_long_value(str(data), 100)
+    st.write(f"{get_json_type_icon(data)} {display_value} ({type(data).__name__})")
+
+# Exact-type dispatch: one dict lookup per value instead of an
+# isinstance cascade, and type(True) is bool so booleans can't fall
+# into the numeric arm
+_VALUE_RENDERERS = {
+    str: _render_str_value,
+    bool: _render_bool_value,
+    int: _render_number_value,
+    float: _render_number_value,
+    type(None): _render_null_value
+}
+
+def _render_value_node(data: Any, path: str) -> None:
+    """Render a primitive value node."""
+    _VALUE_RENDERERS.get(type(data), _render_default_value)(data, path)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_analysis(json_text: str) -> Dict[str, Any]:
+    """
+    Structure analysis for a JSON document, cached by its text.
+
+    Keyed on the raw string like _cached_paths: hashing the text is one
+    C-level pass, where hashing the parsed tree would recurse over
+    every node and overflow on deep documents.
+    """
+    return analyze_json_structure(json.loads(json_text))
+
+def render_json_summary(data: Any, json_text: str = None) -> None:
+    """
+    Render a summary of the JSON structure.
+
+    Args:
+        data: Parsed JSON data
+        json_text: Optional raw JSON text; when given, the analysis is
+            cached across reruns keyed by the text
+    """
+    if json_text is not None:
+        summary = _cached_analysis(json_text)
+    else:
+        summary = analyze_json_structure(data)
+    
+    st.subheader("📊 JSON Summary")
+    
+    # Basic stats
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Keys", summary["total_keys"])
+    
+    with col2:
+        st.metric("Max Depth", summary["max_depth"])
+    
+    with col3:
+        st.metric("Array Items", summary["total_array_items"])
+    
+    with col4:
+        st.metric("Null Values", summary["null_count"])
+    
+    # Type distribution - one markdown flush instead of a widget per type
+    if summary["type_distribution"]:
+        st.subheader("🏷️ Type Distribution")
+        st.markdown("\n".join(
+            f"- **{type_name}**: {count}"
+            for type_name, count in summary["type_distribution"].items()
+        ))
+
+def analyze_json_structure(
+    data: Any,
+    current_depth: int = 0,
+    sample_large_arrays: int = 10_000
+) -> Dict[str, Any]:
+    """
+    Analyze JSON structure and return statistics.
+
+    Not cached directly: st.cache_data would hash the parsed tree
+    recursively to build its key, which costs as much as the analysis
+    and overflows on deep documents. Callers with the raw text can use
+    the text-keyed cache via render_json_summary's json_text argument.
+
+    Args:
+        data: JSON data to analyze
+        current_depth: Current recursion depth
+        sample_large_arrays: Arrays longer than this are stride-sampled
+            for the type histogram and descent (counts stay exact);
+            pass 0 to always walk every element
+
+    Returns:
+        Dictionary with structure analysis; type_distribution and
+        null_count are approximate inside sampled arrays
+    """
+    analysis = {
+        "total_keys": 0,
+        "max_depth": current_depth,
+        "total_array_items": 0,
+        "null_count": 0,
+        "type_distribution": {}
+    }
+
+    # Count the root once, then batch-count each container's children:
+    # Counter.update over a generator runs the per-value work in C
+    # instead of a Python-level dict.get(...) + 1 per node
+    type_counts = Counter((type(data).__name__,))
+
+    # Explicit stack instead of recursion: no Python frame per node, no
+    # recursion-depth ceiling. Only containers are pushed; their leaf
+    # children are fully accounted for by the parent's Counter batch
+    stack = [(data, current_depth)]
+    while stack:
+        obj, depth = stack.pop()
+
+        if isinstance(obj, dict):
+            analysis["total_keys"] += len(obj)
+            children = obj.values()
+        elif isinstance(obj, list):
+            analysis["total_array_items"] += len(obj)
+            children = obj
+            if sample_large_arrays and len(obj) > sample_large_arrays:
+                # Stride-sample huge arrays: a histogram over evenly
+                # spaced elements is statistically the same, and the
+                # walk skips most of the pointer chasing
+                children = obj[::len(obj) // sample_large_arrays]
+        else:
+            continue
+
+        if not obj:
+            continue
+        if depth + 1 > analysis["max_depth"]:
+            analysis["max_depth"] = depth + 1
+        type_counts.update(type(value).__name__ for value in children)
+        stack.extend(
+            (value, depth + 1)
+            for value in children
+            if isinstance(value, (dict, list))
+        )
+
+    # Present None under its JSON name
+    none_count = type_counts.pop("NoneType", 0)
+    if none_count:
+        type_counts["null"] = none_count
+    analysis["null_count"] = none_count
+    analysis["type_distribution"] = dict(type_counts)
+    return analysis
+
+# The selectbox becomes unusable long before this anyway; capping keeps
+# peak memory bounded on multi-MB documents
+_MAX_EXPLORER_PATHS = 10_000
+
+def iter_paths(data: Any) -> Iterator[str]:
+    """
+    Yield every path in document order without materializing the list.
+
+    Args:
+        data: Parsed JSON data
+
+    Yields:
+        Path strings, one per node below the root
+    """
+    for path, _value, _depth in walk_json(data):
+        yield path
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_paths(json_text: str) -> List[str]:
+    """
+    Sorted, de-duplicated path list for a JSON document, cached by text.
+
+    Keyed on the raw string because hashing it is cheap and stable,
+    unlike hashing the parsed tree. Capped at _MAX_EXPLORER_PATHS.
+    """
+    paths = itertools.islice(iter_paths(json.loads(json_text)), _MAX_EXPLORER_PATHS)
+    return sorted(set(paths))
+
+def render_json_path_explorer(data: Any, json_text: str = None) -> None:
+    """
+    Render a path explorer for navigating JSON structure.
+
+    Args:
+        data: Parsed JSON data
+        json_text: Optional raw JSON text; when given, the path list is
+            cached across reruns keyed by the text
+    """
+    st.subheader("🗺️ Path Explorer")
+
+    if json_text is not None:
+        paths = _cached_paths(json_text)
+    else:
+        # No text available: key the extracted paths by object identity
+        # so an unchanged tree isn't re-walked on every rerun
+        cached = st.session_state.get('path_explorer_cache')
+        if cached is not None and cached[0] is data:
+            paths = cached[1]
+        else:
+            paths = list(itertools.islice(iter_paths(data), _MAX_EXPLORER_PATHS))
+            st.session_state.path_explorer_cache = (data, paths)
+
+    if not paths:
+        st.info("No paths found in JSON structure.")
+        return
+
+    if len(paths) == _MAX_EXPLORER_PATHS:
+        st.info(f"Showing the first {_MAX_EXPLORER_PATHS:,} paths.")
+    
+    # Path selector
+    selected_path = st.selectbox(
+        "Select a path to explore:",
+        paths,
+        help="Choose a JSON path to see its value"
+    )
+    
+    if selected_path:
+        try:
+            value = get_value_at_path(data, selected_path)
+            st.write(f"**Path:** `{selected_path}`")
+            st.write("**Value:**")
+            if isinstance(value, (dict, list)):
+                st.json(value)
+            else:
+                st.code(str(value))
+        except Exception as e:
+            st.error(f"Error accessing path: {str(e)}")
+
+def extract_all_paths(data: Any, current_path: str = "") -> List[str]:
+    """
+    Extract all possible paths from JSON data.
+
+    Delegates to the iterative walk_json traversal: no recursion per
+    node, no per-level list concatenation, and no RecursionError on
+    pathologically deep documents.
+
+    Args:
+        data: JSON data
+        current_path: Optional path prefix for all returned paths
+
+    Returns:
+        List of all paths in the JSON
+    """
+    if current_path:
+        # Dict children join with '.', list children attach their '[i]'
+        return [
+            current_path + (path if path.startswith('[') else f".{path}")
+            for path, _value, _depth in walk_json(data)
+        ]
+    return [path for path, _value, _depth in walk_json(data)]
+
+# Compiled once: tokenizes a path into key segments and bracketed indices
+_PATH_RE = re.compile(r'\.?([^.\[\]]+)|\[(\d+)\]')
+
+# Compiled once: accepts only well-formed paths (no unclosed brackets)
+_PATH_VALID_RE = re.compile(r'(?:\.?[^.\[\]]+|\[\d+\])+')
+
+@functools.lru_cache(maxsize=4096)
+def _parse_path(path: str) -> Tuple[Union[str, int], ...]:
+    """
+    Parse a path string into a tuple of keys and indices.
+
+    Parsing is a pure function of the string, and the selectbox re-looks
+    up the same path on every rerun, so the parsed form is memoized at
+    module scope where the cache survives across Streamlit reruns.
+
+    Args:
+        path: Path string (e.g. "user.profile.name" or "items[0].id")
+
+    Returns:
+        Tuple of string keys and integer indices
+
+    Raises:
+        ValueError: If the path is malformed
+    """
+    if _PATH_VALID_RE.fullmatch(path) is None:
+        raise ValueError(f"Malformed path: {path}")
+    return tuple(
+        int(index) if index else key
+        for key, index in _PATH_RE.findall(path)
+    )
+
+def get_value_at_path(data: Any, path: str) -> Any:
+    """
+    Get value at a specific JSON path.
+    
+    Args:
+        data: JSON data
+        path: Path string (e.g., "user.profile.name" or "items[0].id")
+    
+    Returns:
+        Value at the specified path
+    
+    Raises:
+        KeyError: If path doesn't exist
+        IndexError: If array index is out of range
+    """
+    if not path:
+        return data
+
+    # Parse (memoized) once, then the walk is just subscript operations
+    current = data
+    for part in _parse_path(path):
+        current = current[part]
+
+    return current
+
+def get_values_at_paths(data: Any, paths: List[str]) -> List[Any]:
+    """
+    Resolve many paths against the same document in one batch.
+
+    Work is shared across queries: every intermediate node reached is
+    memoized by its path prefix, so sibling paths (the common shape of
+    extract_all_paths output) re-walk only their final segment instead
+    of starting from the root each time.
+
+    Args:
+        data: Parsed JSON data
+        paths: Path strings to resolve
+
+    Returns:
+        Values in the same order as paths
+
+    Raises:
+        ValueError: If a path is malformed
+        KeyError: If a key doesn't exist
+        IndexError: If an array index is out of range
+    """
+    missing = object()
+    reached = {(): data}
+    results = []
+
+    for path in paths:
+        parts = _parse_path(path) if path else ()
+
+        # Walk back to the longest already-visited prefix
+        i = len(parts)
+        current = missing
+        while i > 0:
+            current = reached.get(parts[:i], missing)
+            if current is not missing:
+                break
+            i -= 1
+        if current is missing:
+            current = data
+
+        # Walk (and memoize) the remaining segments
+        for j in range(i, len(parts)):
+            current = current[parts[j]]
+            reached[parts[:j + 1]] = current
+
+        results.append(current)
+
+    return results
\ No newline at end of file
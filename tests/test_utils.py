@@ -4,7 +4,7 @@ Unit tests for utility functions and core JSON processing for Text Tools.
 
 import pytest
 import json
-from src.formatter import format_json, minify_json, validate_and_format
+from src.formatter import format_json, minify_json, compact_format_json, validate_and_format
 from src.validator import validate_json, validate_against_schema
 from src.utils import sanitize_text, safe_json_key, truncate_long_value, get_json_type_icon
 
@@ -41,6 +41,28 @@ class TestFormatter:
         result = minify_json(input_json)
         assert result == expected
     
+    def test_compact_format_roundtrip(self):
+        """Test that compact formatting preserves the document."""
+        input_json = '{"users":[{"name":"Ann","tags":["a","b"]},{"name":"Bob","tags":[]}],"total":2}'
+        result = compact_format_json(input_json, max_line_length=40)
+        assert json.loads(result) == json.loads(input_json)
+
+    def test_compact_format_short_stays_inline(self):
+        """Test that documents fitting the line budget stay on one line."""
+        input_json = '{"name": "test", "value": 123}'
+        result = compact_format_json(input_json, max_line_length=80)
+        assert '\n' not in result
+        assert result == '{"name":"test","value":123}'
+
+    def test_compact_format_long_container_expands(self):
+        """Test that containers exceeding max_line_length expand."""
+        input_json = json.dumps({"items": list(range(50))})
+        result = compact_format_json(input_json, max_line_length=30)
+        lines = result.split('\n')
+        assert len(lines) > 1
+        # Every line respects the budget once containers are expanded
+        assert all(len(line) <= 30 for line in lines)
+
     def test_validate_and_format_valid(self):
         """Test combined validation and formatting."""
         input_json = '{"test":true}'